@@ -6,14 +6,801 @@ from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.oxml import OxmlElement
 from docx.oxml.ns import qn
 from docx.opc.constants import RELATIONSHIP_TYPE
+from docx.opc.pkgwriter import PackageWriter
 import json
 import subprocess
 import os
 import shutil
+import io
+import hashlib
+import tarfile
+import tempfile
+import zipfile
+import sqlite3
 from datetime import datetime
 import threading
+import queue
+from concurrent.futures import ThreadPoolExecutor
 import time
 import re
+import bisect
+
+# Shape of the resume JSON consumed by build_resume_document. Optional fields
+# that the generator only reads when truthy are nullable; 'ignore_other_types'
+# marks fields the generator silently skips when they have a different type.
+RESUME_SCHEMA = {
+    'type': 'object',
+    'required': {
+        'name': {'type': 'string'},
+    },
+    'optional': {
+        'title': {'type': 'string'},
+        'contact': {
+            'type': 'object',
+            'optional': {
+                'portfolio': {'type': 'string', 'nullable': True},
+                'linkedin': {'type': 'string', 'nullable': True},
+                'email': {'type': 'string', 'nullable': True},
+                'phone': {'type': 'string', 'nullable': True},
+            },
+        },
+        'portfolio': {'type': 'string', 'nullable': True},
+        'linkedin': {'type': 'string', 'nullable': True},
+        'email': {'type': 'string', 'nullable': True},
+        'phone': {'type': 'string', 'nullable': True},
+        'professional_summary': {'type': 'array', 'nullable': True, 'items': {'type': 'string'}},
+        'technical_skills': {
+            'type': 'object',
+            'nullable': True,
+            'values': {'type': 'array', 'items': {'type': 'string'}},
+        },
+        'experience': {
+            'type': 'array',
+            'nullable': True,
+            'items': {
+                'type': 'object',
+                'required': {
+                    'role': {'type': 'string'},
+                    'company': {'type': 'string'},
+                },
+                'optional': {
+                    'duration': {'type': 'scalar', 'nullable': True},
+                    'project_overview': {'type': 'string', 'nullable': True},
+                    'responsibilities': {'type': 'array', 'nullable': True, 'items': {'type': 'string'}},
+                    'environment': {'type': 'array', 'nullable': True, 'items': {'type': 'string'}},
+                },
+            },
+        },
+        'education': {
+            'type': 'object',
+            'nullable': True,
+            'ignore_other_types': True,
+            'optional': {
+                'degree': {'type': 'string', 'nullable': True},
+                'field': {'type': 'string', 'nullable': True},
+                'institution': {'type': 'scalar', 'nullable': True},
+                'year': {'type': 'scalar', 'nullable': True},
+            },
+        },
+        'certifications': {'type': 'array', 'nullable': True, 'items': {'type': 'string'}},
+    },
+}
+
+
+def compile_schema(schema):
+    """Compile a schema dict into a check(value, path, errors) function"""
+    node_type = schema['type']
+    nullable = schema.get('nullable', False)
+    ignore_other_types = schema.get('ignore_other_types', False)
+
+    if node_type == 'string':
+        expected = "a string"
+        matches_type = lambda value: isinstance(value, str)
+    elif node_type == 'scalar':
+        expected = "a string or number"
+        matches_type = lambda value: isinstance(value, (str, int, float)) and not isinstance(value, bool)
+    elif node_type == 'array':
+        expected = "an array"
+        matches_type = lambda value: isinstance(value, list)
+        check_item = compile_schema(schema['items'])
+    elif node_type == 'object':
+        expected = "an object"
+        matches_type = lambda value: isinstance(value, dict)
+        required = {key: compile_schema(child) for key, child in schema.get('required', {}).items()}
+        optional = {key: compile_schema(child) for key, child in schema.get('optional', {}).items()}
+        check_value = compile_schema(schema['values']) if 'values' in schema else None
+    else:
+        raise ValueError(f"Unsupported schema type: {node_type}")
+
+    def check(value, path, errors):
+        if value is None and nullable:
+            return
+        if not matches_type(value):
+            if ignore_other_types:
+                return
+            errors.append((path, f"expected {expected}, got {type(value).__name__}"))
+            return
+
+        if node_type == 'array':
+            for index, item in enumerate(value):
+                check_item(item, f"{path}[{index}]", errors)
+        elif node_type == 'object':
+            for key, check_child in required.items():
+                if key not in value:
+                    errors.append((f"{path}.{key}", "missing required field"))
+                else:
+                    check_child(value[key], f"{path}.{key}", errors)
+            for key, check_child in optional.items():
+                if key in value:
+                    check_child(value[key], f"{path}.{key}", errors)
+            if check_value is not None:
+                for key, child_value in value.items():
+                    check_value(child_value, f"{path}.{key}", errors)
+
+    return check
+
+
+RESUME_VALIDATOR = compile_schema(RESUME_SCHEMA)
+
+
+def validate_resume_data(data):
+    """Return a list of (json_path, message) errors for parsed resume data"""
+    errors = []
+    RESUME_VALIDATOR(data, "$", errors)
+    return errors
+
+
+def validate_resume_file(json_path):
+    """Validate one resume JSON file, returning 'file: path: message' strings"""
+    file_name = os.path.basename(json_path)
+    try:
+        with open(json_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except json.JSONDecodeError as e:
+        return [f"{file_name}: line {e.lineno}, column {e.colno}: invalid JSON ({e.msg})"]
+    except Exception as e:
+        return [f"{file_name}: failed to read file ({e})"]
+    return [f"{file_name}: {path}: {message}" for path, message in validate_resume_data(data)]
+
+
+def validate_resume_batch(json_paths, max_workers=None):
+    """Validate many resume JSON files in parallel; returns {path: [errors]} for failing files"""
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(validate_resume_file, json_paths)
+        return {path: errors for path, errors in zip(json_paths, results) if errors}
+
+
+# Compiled bold-skill patterns keyed by the skills list
+_skill_pattern_cache = {}
+
+
+def compile_skill_pattern(bold_skills):
+    """Return a cached case-insensitive whole-word pattern for bold_skills, longest skill first"""
+    key = tuple(bold_skills)
+    pattern = _skill_pattern_cache.get(key)
+    if pattern is None:
+        # Sort skills by length (longest first) to avoid partial matches
+        sorted_skills = sorted(bold_skills, key=len, reverse=True)
+        pattern = re.compile("|".join(f"\\b{re.escape(skill)}\\b" for skill in sorted_skills), re.IGNORECASE)
+        _skill_pattern_cache[key] = pattern
+    return pattern
+
+
+def flatten_resume_fields(data):
+    """Return (json_path, text) for every field that gets bold-skill highlighting, in render order"""
+    fields = []
+    for index, item in enumerate(data.get('professional_summary') or []):
+        fields.append((f"$.professional_summary[{index}]", item))
+    for category, skills in (data.get('technical_skills') or {}).items():
+        fields.append((f"$.technical_skills.{category}", ", ".join(skills)))
+    for job_index, job in enumerate(data.get('experience') or []):
+        path = f"$.experience[{job_index}]"
+        if job.get('project_overview'):
+            fields.append((f"{path}.project_overview", job['project_overview']))
+        for index, item in enumerate(job.get('responsibilities') or []):
+            fields.append((f"{path}.responsibilities[{index}]", item))
+        if job.get('environment'):
+            fields.append((f"{path}.environment", ", ".join(job['environment'])))
+    return fields
+
+
+class HighlightIndex:
+    """Bold-skill spans for every highlightable field of a resume, found in one scan"""
+
+    # Fields are joined with a newline so whole-word boundaries behave exactly as
+    # they would on each field alone
+    FIELD_SEPARATOR = "\n"
+
+    def __init__(self, data, bold_skills):
+        self.bold_skills = list(bold_skills)
+        self.fields = flatten_resume_fields(data)
+        self.spans = {}
+
+        if not bold_skills or not self.fields:
+            return
+
+        canonical = {skill.lower(): skill for skill in bold_skills}
+        texts = [text for _, text in self.fields]
+        buffer = self.FIELD_SEPARATOR.join(texts)
+        starts = []
+        offset = 0
+        for text in texts:
+            starts.append(offset)
+            offset += len(text) + len(self.FIELD_SEPARATOR)
+
+        for match in compile_skill_pattern(bold_skills).finditer(buffer):
+            field_index = bisect.bisect_right(starts, match.start()) - 1
+            field_start = starts[field_index]
+            if match.end() > field_start + len(texts[field_index]):
+                continue
+            matched_text = match.group(0)
+            self.spans.setdefault(self.fields[field_index][0], []).append(
+                (match.start() - field_start, match.end() - field_start,
+                 canonical.get(matched_text.lower(), matched_text)))
+
+    def spans_for(self, field_path):
+        """Return [(start, end, skill)] for one field, offsets local to that field's text"""
+        return self.spans.get(field_path, [])
+
+    def to_dict(self):
+        """Serializable form of the index, used for the ATS span export"""
+        return {
+            'fields': [
+                {
+                    'field': field_path,
+                    'text': text,
+                    'spans': [{'start': start, 'end': end, 'text': text[start:end], 'skill': skill}
+                              for start, end, skill in self.spans_for(field_path)],
+                }
+                for field_path, text in self.fields
+            ]
+        }
+
+
+class SkillIndex:
+    """Persistent skill -> resume index for one output directory, recorded as a side effect of highlighting"""
+
+    INDEX_FILENAME = ".resume_skill_index.json"
+
+    def __init__(self, index_path):
+        self.index_path = index_path
+        self.lock = threading.Lock()
+        self.save_lock = threading.Lock()
+        self.dirty = False
+        self.skills = {}   # normalized skill -> {resume: [field paths]}
+        self.resumes = {}  # resume -> {'source': json path, 'bold_skills': [keywords rendered with], 'fields': [[field path, text]]}
+        if os.path.exists(index_path):
+            try:
+                with open(index_path, 'r', encoding='utf-8') as f:
+                    stored = json.load(f)
+                self.skills = stored.get('skills', {})
+                self.resumes = stored.get('resumes', {})
+            except Exception as e:
+                print(f"❌ Ignoring unreadable skill index {index_path}: {e}")
+
+    @staticmethod
+    def normalize(skill):
+        # Matching is case-insensitive, so case is the only difference that never changes output
+        return skill.lower()
+
+    def record(self, resume, source, highlight_index):
+        """Replace everything known about one resume with the matches from its HighlightIndex; save() persists it"""
+        with self.lock:
+            stale = [key for key, entry in self.resumes.items()
+                     if key == resume or (source and entry.get('source') == source)]
+            for key in stale:
+                self._forget(key)
+
+            for field_path, spans in highlight_index.spans.items():
+                for _, _, skill in spans:
+                    fields = self.skills.setdefault(self.normalize(skill), {}).setdefault(resume, [])
+                    if field_path not in fields:
+                        fields.append(field_path)
+            self.resumes[resume] = {
+                'source': source,
+                'bold_skills': highlight_index.bold_skills,
+                'fields': [[field_path, text] for field_path, text in highlight_index.fields],
+            }
+            self.dirty = True
+
+    def knows(self, resume, source):
+        """True if the index already holds this resume as rendered from this source"""
+        with self.lock:
+            return resume in self.resumes and self.resumes[resume].get('source') == source
+
+    def _forget(self, resume):
+        self.resumes.pop(resume, None)
+        for skill in list(self.skills):
+            self.skills[skill].pop(resume, None)
+            if not self.skills[skill]:
+                del self.skills[skill]
+
+    def save(self):
+        """Write the index if anything was recorded since the last save"""
+        # save_lock spans snapshot and write so an older snapshot can never land after a newer one;
+        # renders only wait on self.lock for the snapshot, not the disk write
+        with self.save_lock:
+            with self.lock:
+                if not self.dirty:
+                    return
+                content = json.dumps({'version': 1, 'skills': self.skills, 'resumes': self.resumes})
+                self.dirty = False
+            try:
+                temp_path = self.index_path + ".tmp"
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    f.write(content)
+                os.replace(temp_path, self.index_path)
+            except Exception:
+                with self.lock:
+                    self.dirty = True
+                raise
+
+    def resumes_affected_by_skills(self, new_skills):
+        """Return {resume: source} for resumes whose bold runs change when re-rendered with new_skills"""
+        new_normalized = {self.normalize(skill) for skill in new_skills}
+
+        with self.lock:
+            # Each resume is diffed against the keywords it was actually rendered with
+            affected = set()
+            by_recorded_skills = {}
+            for resume, entry in self.resumes.items():
+                if 'bold_skills' not in entry:
+                    # Indexed before keyword lists were recorded, so the change can't be ruled out
+                    affected.add(resume)
+                else:
+                    by_recorded_skills.setdefault(tuple(entry['bold_skills']), []).append(resume)
+
+            for recorded_skills, resumes in by_recorded_skills.items():
+                recorded_normalized = {self.normalize(skill) for skill in recorded_skills}
+                removed = recorded_normalized - new_normalized
+                added = [skill for skill in new_skills if self.normalize(skill) not in recorded_normalized]
+                for skill in removed:
+                    affected.update(resume for resume in self.skills.get(skill, {}) if resume in resumes)
+                # Added keywords were never indexed, so scan the stored field text for them
+                if added:
+                    pattern = compile_skill_pattern(added)
+                    affected.update(resume for resume in resumes
+                                    if any(pattern.search(text) for _, text in self.resumes[resume]['fields']))
+            return {resume: self.resumes[resume].get('source') for resume in affected}
+
+
+def skills_profile(bold_skills):
+    """Short stable hash identifying a bold skills list"""
+    normalized = sorted({skill.lower() for skill in bold_skills})
+    return hashlib.sha256("\n".join(normalized).encode('utf-8')).hexdigest()[:16]
+
+
+class ResumeStore:
+    """SQLite store of resume sources, rendered variants and the catalog of generated artifacts"""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS resume_sources (
+            id INTEGER PRIMARY KEY,
+            content_hash TEXT NOT NULL UNIQUE,
+            path TEXT,
+            name TEXT,
+            title TEXT,
+            json TEXT NOT NULL,
+            added_at TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS resume_variants (
+            id INTEGER PRIMARY KEY,
+            source_id INTEGER NOT NULL REFERENCES resume_sources(id),
+            title TEXT,
+            filename TEXT NOT NULL,
+            skills_profile TEXT NOT NULL,
+            font_name TEXT NOT NULL,
+            font_size INTEGER NOT NULL,
+            output_format TEXT NOT NULL,
+            UNIQUE (source_id, filename, skills_profile, font_name, font_size, output_format)
+        );
+        CREATE TABLE IF NOT EXISTS artifacts (
+            id INTEGER PRIMARY KEY,
+            variant_id INTEGER NOT NULL REFERENCES resume_variants(id),
+            kind TEXT NOT NULL,
+            path TEXT NOT NULL,
+            output_dir TEXT,
+            sha256 TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            render_seconds REAL,
+            save_seconds REAL,
+            convert_seconds REAL,
+            created_at TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_sources_title ON resume_sources(title);
+        CREATE INDEX IF NOT EXISTS idx_variants_title ON resume_variants(title);
+        CREATE INDEX IF NOT EXISTS idx_variants_skills_profile ON resume_variants(skills_profile);
+        CREATE INDEX IF NOT EXISTS idx_variants_font ON resume_variants(font_name, font_size);
+        CREATE INDEX IF NOT EXISTS idx_artifacts_variant ON artifacts(variant_id);
+        CREATE INDEX IF NOT EXISTS idx_artifacts_created_at ON artifacts(created_at);
+    """
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.lock = threading.Lock()
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self.connection = sqlite3.connect(db_path, check_same_thread=False, timeout=30)
+        self.connection.row_factory = sqlite3.Row
+        with self.lock:
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("PRAGMA synchronous=NORMAL")
+            self.connection.executescript(self.SCHEMA)
+            # Catalogs created before artifacts had an output_dir column
+            columns = {row['name'] for row in self.connection.execute("PRAGMA table_info(artifacts)")}
+            if 'output_dir' not in columns:
+                self.connection.execute("ALTER TABLE artifacts ADD COLUMN output_dir TEXT")
+                for row in self.connection.execute("SELECT id, path FROM artifacts").fetchall():
+                    self.connection.execute("UPDATE artifacts SET output_dir = ? WHERE id = ?",
+                                            (self.normalize_dir(os.path.dirname(row['path'])), row['id']))
+            self.connection.execute("CREATE INDEX IF NOT EXISTS idx_artifacts_output_dir ON artifacts(variant_id, output_dir)")
+            self.connection.commit()
+
+    @staticmethod
+    def normalize_dir(directory):
+        return os.path.normcase(os.path.abspath(directory))
+
+    def add_source(self, json_string, path=None):
+        """Store a resume JSON source (deduplicated by content) and return its id"""
+        data = json.loads(json_string)
+        canonical = json.dumps(data, sort_keys=True, ensure_ascii=False)
+        content_hash = hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+        with self.lock, self.connection:
+            self.connection.execute(
+                "INSERT OR IGNORE INTO resume_sources (content_hash, path, name, title, json, added_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (content_hash, path, data.get('name'), data.get('title'), json_string,
+                 datetime.now().isoformat(timespec='seconds')))
+            if path:
+                self.connection.execute("UPDATE resume_sources SET path = ? WHERE content_hash = ?", (path, content_hash))
+            row = self.connection.execute("SELECT id FROM resume_sources WHERE content_hash = ?", (content_hash,)).fetchone()
+        return row['id']
+
+    def get_source(self, source_id):
+        with self.lock:
+            return self.connection.execute("SELECT * FROM resume_sources WHERE id = ?", (source_id,)).fetchone()
+
+    def _variant_id(self, source_id, title, filename, profile, font_name, font_size, output_format):
+        self.connection.execute(
+            "INSERT OR IGNORE INTO resume_variants "
+            "(source_id, title, filename, skills_profile, font_name, font_size, output_format) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (source_id, title, filename, profile, font_name, font_size, output_format))
+        row = self.connection.execute(
+            "SELECT id FROM resume_variants WHERE source_id = ? AND filename = ? AND skills_profile = ? "
+            "AND font_name = ? AND font_size = ? AND output_format = ?",
+            (source_id, filename, profile, font_name, font_size, output_format)).fetchone()
+        return row['id']
+
+    def record_render(self, source_id, title, filename, profile, font_name, font_size, output_format, artifact_paths, timings):
+        """Catalog the files produced by one render, replacing older entries for the same paths"""
+        artifacts = []
+        for kind, path in artifact_paths:
+            with open(path, 'rb') as f:
+                data = f.read()
+            artifacts.append((kind, os.path.abspath(path), hashlib.sha256(data).hexdigest(), len(data)))
+        created_at = datetime.now().isoformat(timespec='seconds')
+        with self.lock, self.connection:
+            variant_id = self._variant_id(source_id, title, filename, profile, font_name, font_size, output_format)
+            for kind, path, sha256, size in artifacts:
+                self.connection.execute("DELETE FROM artifacts WHERE path = ?", (path,))
+                self.connection.execute(
+                    "INSERT INTO artifacts (variant_id, kind, path, output_dir, sha256, size, render_seconds, save_seconds, "
+                    "convert_seconds, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (variant_id, kind, path, self.normalize_dir(os.path.dirname(path)), sha256, size,
+                     timings.get('render'), timings.get('save'), timings.get('convert'), created_at))
+
+    def find_current_artifacts(self, source_id, filename, profile, font_name, font_size, output_format, output_dir):
+        """Return catalogued artifacts for an identical render in output_dir if they are all unchanged on disk, else []"""
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT a.* FROM artifacts a JOIN resume_variants v ON v.id = a.variant_id "
+                "WHERE v.source_id = ? AND v.filename = ? AND v.skills_profile = ? AND v.font_name = ? "
+                "AND v.font_size = ? AND v.output_format = ? AND a.output_dir = ?",
+                (source_id, filename, profile, font_name, font_size, output_format,
+                 self.normalize_dir(output_dir))).fetchall()
+        expected_kinds = {"DOCX Only": {'docx'}, "PDF Only": {'pdf'}, "Both (DOCX + PDF)": {'docx', 'pdf'}}[output_format]
+        if {row['kind'] for row in rows} != expected_kinds:
+            return []
+        for row in rows:
+            # Size is a cheap first check; the hash catches same-size edits
+            if not os.path.exists(row['path']) or os.path.getsize(row['path']) != row['size']:
+                return []
+            with open(row['path'], 'rb') as f:
+                if hashlib.sha256(f.read()).hexdigest() != row['sha256']:
+                    return []
+        return rows
+
+    def query_artifacts(self, title=None, font_name=None, font_size=None, skills_profile=None, since=None, limit=500):
+        """Search the artifact catalog; title is a substring match, since an ISO date or timestamp"""
+        clauses = []
+        params = []
+        if title:
+            clauses.append("v.title LIKE ?")
+            params.append(f"%{title}%")
+        if font_name:
+            clauses.append("v.font_name = ?")
+            params.append(font_name)
+        if font_size:
+            clauses.append("v.font_size = ?")
+            params.append(int(font_size))
+        if skills_profile:
+            clauses.append("v.skills_profile = ?")
+            params.append(skills_profile)
+        if since:
+            clauses.append("a.created_at >= ?")
+            params.append(since)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self.lock:
+            return self.connection.execute(
+                "SELECT a.*, v.source_id, v.title, v.filename, v.skills_profile, v.font_name, v.font_size, v.output_format "
+                f"FROM artifacts a JOIN resume_variants v ON v.id = a.variant_id {where} "
+                "ORDER BY a.created_at DESC LIMIT ?", (*params, limit)).fetchall()
+
+
+def ram_scratch_dir():
+    """Writable RAM-backed directory, or None when the OS doesn't provide one (e.g. Windows)"""
+    if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK):
+        return '/dev/shm'
+    return None
+
+
+def intermediate_temp_dir():
+    """RAM-backed scratch directory when the OS provides one, otherwise the system temp dir"""
+    return ram_scratch_dir() or tempfile.gettempdir()
+
+
+class StoredZipPkgWriter:
+    """Stand-in for python-docx's zip package writer that stores parts without compression"""
+
+    def __init__(self, pkg_file):
+        self.zipf = zipfile.ZipFile(pkg_file, 'w', compression=zipfile.ZIP_STORED)
+
+    def write(self, pack_uri, blob):
+        self.zipf.writestr(pack_uri.membername, blob)
+
+    def close(self):
+        self.zipf.close()
+
+
+def save_docx_uncompressed(doc, pkg_file):
+    """Save doc as a ZIP-stored package; meant for intermediates that are converted and discarded"""
+    package = doc.part.package
+    parts = package.parts
+    for part in parts:
+        part.before_marshal()
+    # Same steps as PackageWriter.write, with the uncompressed writer swapped in.
+    # These are private python-docx helpers; re-check them whenever the
+    # python-docx==1.1.0 pin in requirements.txt changes.
+    writer = StoredZipPkgWriter(pkg_file)
+    PackageWriter._write_content_types_stream(writer, parts)
+    PackageWriter._write_pkg_rels(writer, package.rels)
+    PackageWriter._write_parts(writer, parts)
+    writer.close()
+
+
+# Per-thread converter state; a worker can park a live Word instance here so
+# repeated conversions skip the application startup cost
+converter_state = threading.local()
+
+
+# Suffix of the bold-span exports written next to the resume outputs
+SPANS_SUFFIX = "_spans.json"
+
+
+def is_resume_json_name(name):
+    """True for file names that can hold a resume; dotfiles and the app's own spans exports never do"""
+    name = name.lower()
+    return name.endswith('.json') and not name.startswith('.') and not name.endswith(SPANS_SUFFIX)
+
+
+class ResumeWatcher:
+    """Watches a resume directory and the bold skills file, reporting debounced bursts of changes"""
+
+    def __init__(self, input_dir, bold_skills_path, on_change, debounce=0.3, poll_interval=0.5):
+        self.input_dir = os.path.normcase(os.path.abspath(input_dir))
+        self.bold_skills_path = os.path.normcase(os.path.abspath(bold_skills_path)) if bold_skills_path else None
+        self.on_change = on_change
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.pending = set()
+        self.last_event = 0.0
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.observer = None
+        self.mode = None
+
+    def is_relevant(self, path):
+        path = os.path.normcase(os.path.abspath(path))
+        if path == self.bold_skills_path:
+            return True
+        return is_resume_json_name(os.path.basename(path)) and os.path.dirname(path) == self.input_dir
+
+    def record(self, path):
+        if self.is_relevant(path):
+            with self.lock:
+                self.pending.add(os.path.normcase(os.path.abspath(path)))
+                self.last_event = time.monotonic()
+
+    def snapshot(self):
+        """Return {path: (mtime, size)} for every watched file, used by the polling fallback"""
+        paths = []
+        try:
+            paths = [os.path.join(self.input_dir, name) for name in os.listdir(self.input_dir)]
+        except OSError:
+            pass
+        if self.bold_skills_path:
+            paths.append(self.bold_skills_path)
+        state = {}
+        for path in paths:
+            if not self.is_relevant(path):
+                continue
+            try:
+                stat = os.stat(path)
+                state[os.path.normcase(os.path.abspath(path))] = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                pass
+        return state
+
+    def start(self):
+        try:
+            # Native change notifications (inotify / ReadDirectoryChangesW) if watchdog is installed
+            from watchdog.observers import Observer
+            from watchdog.events import FileSystemEventHandler
+
+            watcher = self
+
+            class ChangeHandler(FileSystemEventHandler):
+                # Only content changes count; inotify also reports opened/closed events, and
+                # reacting to those would retrigger on the worker's own reads of the files
+                def on_created(self, event):
+                    if not event.is_directory:
+                        watcher.record(event.src_path)
+
+                def on_modified(self, event):
+                    if not event.is_directory:
+                        watcher.record(event.src_path)
+
+                def on_deleted(self, event):
+                    if not event.is_directory:
+                        watcher.record(event.src_path)
+
+                def on_moved(self, event):
+                    if not event.is_directory:
+                        watcher.record(event.src_path)
+                        watcher.record(event.dest_path)
+
+            self.observer = Observer()
+            watch_dirs = {self.input_dir}
+            if self.bold_skills_path:
+                watch_dirs.add(os.path.dirname(self.bold_skills_path))
+            for directory in watch_dirs:
+                if os.path.isdir(directory):
+                    self.observer.schedule(ChangeHandler(), directory, recursive=False)
+            self.observer.start()
+            self.mode = "events"
+        except ImportError:
+            print("❌ watchdog not available, falling back to polling")
+            # A burst can straddle two polls, so stay quiet for longer than one interval
+            self.debounce = max(self.debounce, self.poll_interval * 1.5)
+            threading.Thread(target=self.poll_loop, daemon=True).start()
+            self.mode = "polling"
+
+        threading.Thread(target=self.debounce_loop, daemon=True).start()
+        print(f"✅ Watching {self.input_dir} ({self.mode})")
+
+    def poll_loop(self):
+        previous = self.snapshot()
+        while not self.stop_event.wait(self.poll_interval):
+            current = self.snapshot()
+            for path in set(previous) | set(current):
+                if previous.get(path) != current.get(path):
+                    self.record(path)
+            previous = current
+
+    def debounce_loop(self):
+        while not self.stop_event.wait(0.05):
+            with self.lock:
+                if not self.pending or time.monotonic() - self.last_event < self.debounce:
+                    continue
+                changed = self.pending
+                self.pending = set()
+            try:
+                self.on_change(changed)
+            except Exception as e:
+                print(f"❌ Watch callback failed: {e}")
+
+    def stop(self):
+        self.stop_event.set()
+        if self.observer is not None:
+            self.observer.stop()
+            self.observer.join(timeout=2)
+            self.observer = None
+
+
+class ResumeBundleWriter:
+    """Streams generated resume files into a single ZIP or TAR archive with a JSON manifest"""
+
+    def __init__(self, bundle_path, archive_format="zip", compression_level=6):
+        self.bundle_path = bundle_path
+        self.archive_format = archive_format
+        self.compression_level = compression_level
+        self.entries = []
+        self.lock = threading.Lock()
+
+        if archive_format == "zip":
+            if compression_level > 0:
+                self.archive = zipfile.ZipFile(bundle_path, 'w', compression=zipfile.ZIP_DEFLATED,
+                                               compresslevel=compression_level)
+            else:
+                self.archive = zipfile.ZipFile(bundle_path, 'w', compression=zipfile.ZIP_STORED)
+        elif archive_format == "tar":
+            # Only .tar.gz/.tgz are gzipped; a plain .tar is always written uncompressed
+            if bundle_path.lower().endswith((".tar.gz", ".tgz")):
+                self.archive = tarfile.open(bundle_path, 'w:gz', compresslevel=compression_level)
+            else:
+                self.compression_level = 0
+                self.archive = tarfile.open(bundle_path, 'w')
+        else:
+            raise ValueError(f"Unsupported bundle format: {archive_format}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _write_entry(self, arcname, data):
+        if self.archive_format == "zip":
+            self.archive.writestr(arcname, data)
+        else:
+            info = tarfile.TarInfo(arcname)
+            info.size = len(data)
+            info.mtime = int(time.time())
+            self.archive.addfile(info, io.BytesIO(data))
+
+    def add_bytes(self, arcname, data, source=None, timings=None):
+        """Append in-memory file data to the archive and record it in the manifest"""
+        with self.lock:
+            self._write_entry(arcname, data)
+            self.entries.append({
+                'name': arcname,
+                'source': source,
+                'sha256': hashlib.sha256(data).hexdigest(),
+                'size': len(data),
+                'timings': dict(timings or {}),
+            })
+
+    def add_file(self, arcname, path, source=None, timings=None):
+        """Append a file from disk to the archive and record it in the manifest"""
+        with open(path, 'rb') as f:
+            data = f.read()
+        self.add_bytes(arcname, data, source=source, timings=timings)
+
+    def close(self):
+        """Write the manifest and close the archive"""
+        with self.lock:
+            manifest = {
+                'created': datetime.now().isoformat(timespec='seconds'),
+                'format': self.archive_format,
+                'compression_level': self.compression_level,
+                'entries': self.entries,
+            }
+            self._write_entry("manifest.json", json.dumps(manifest, indent=2).encode('utf-8'))
+            self.archive.close()
+
+
+class BatchItem:
+    """One resume JSON file queued in the batch panel"""
+
+    def __init__(self, item_id, json_path):
+        self.item_id = item_id
+        self.json_path = json_path
+        self.filename = None
+        self.status = "Pending"
+        self.timings = {}
+        self.error = None
+        self.future = None
+        self.cancel_event = threading.Event()
+
 
 class ResumeGeneratorApp:
     def __init__(self, root, default_output_dir="D:/Resumes_Data_Engineers/New_Resumes", default_filename="Yallaiah_Senior_Data_Engineer"):
@@ -33,10 +820,35 @@ class ResumeGeneratorApp:
         self.default_output_dir = default_output_dir
         self.default_filename = default_filename
         self.default_bold_skills_path = "D:/Resumes_Data_Engineers/New_Resumes/bold_keywords.json"
+        self.watcher = None
+        self.watch_queue = None
+        self.skill_indexes = {}
+        self.skill_indexes_lock = threading.Lock()
+        self.resume_store = None
+        self.resume_store_path = os.path.join(os.path.expanduser("~"), ".resume_generator", "resume_catalog.db")
+        self.resume_store_lock = threading.Lock()
+        self.catalog_window = None
+        
+        # Batch queue state; workers only ever talk to the panel through batch_events,
+        # which is replaced on close so a reopened panel never sees a previous session's events
+        self.batch_window = None
+        self.batch_items = {}
+        self.batch_events = queue.Queue()
+        self.batch_executor = None
+        self.batch_settings = None
+        self.batch_bold_skills = []
+        self.batch_lock = threading.Lock()
+        self.batch_filenames = set()
+        self.batch_started_at = None
+        self.batch_completed = 0
+
+        # Worker threads never touch widgets; they post events here for the main loop
+        self.ui_events = queue.Queue()
 
         # Configure modern styles
         self.configure_styles()
         self.create_widgets()
+        self.root.after(50, self.process_ui_events)
         
     def configure_styles(self):
         self.style = ttk.Style()
@@ -175,6 +987,13 @@ class ResumeGeneratorApp:
                                          values=['9', '10', '11', '12', '13', '14'], 
                                          state="readonly", width=8)
         font_size_combo.grid(row=0, column=3, sticky=tk.W)
+
+        ttk.Label(font_frame, text="Bundle Compression:").grid(row=0, column=4, sticky=tk.W, padx=(20, 10))
+        self.bundle_level_var = tk.StringVar(value="6")
+        bundle_level_combo = ttk.Combobox(font_frame, textvariable=self.bundle_level_var,
+                                          values=[str(level) for level in range(10)],
+                                          state="readonly", width=5)
+        bundle_level_combo.grid(row=0, column=5, sticky=tk.W)
         
         # Bold Skills JSON Path section
         bold_skills_frame = ttk.Frame(config_frame)
@@ -187,6 +1006,10 @@ class ResumeGeneratorApp:
         
         ttk.Button(bold_skills_frame, text="📁 Browse", command=self.browse_bold_skills_file).grid(row=0, column=2)
         
+        self.export_spans_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(bold_skills_frame, text="Export bold spans (ATS)",
+                        variable=self.export_spans_var).grid(row=0, column=3, padx=(10, 0), sticky=tk.W)
+        
         # JSON input section with modern styling
         json_frame = ttk.LabelFrame(main_frame, text="📄 Resume JSON Data", padding="15")
         json_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
@@ -223,6 +1046,11 @@ class ResumeGeneratorApp:
         left_buttons.pack(side=tk.LEFT)
         
         ttk.Button(left_buttons, text="📂 Load JSON", command=self.load_json_file).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Button(left_buttons, text="📋 Batch Queue", command=self.open_batch_panel).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Button(left_buttons, text="🗂️ Catalog", command=self.open_catalog_panel).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Button(left_buttons, text="📦 Batch Bundle", command=self.generate_bundle_threaded).pack(side=tk.LEFT, padx=(0, 10))
+        self.watch_button = ttk.Button(left_buttons, text="👁️ Watch", command=self.toggle_watch_mode)
+        self.watch_button.pack(side=tk.LEFT, padx=(0, 10))
         ttk.Button(left_buttons, text="🗑️ Clear", command=self.clear_fields, 
                            style='Danger.TButton').pack(side=tk.LEFT, padx=(0, 10))
         
@@ -287,7 +1115,7 @@ class ResumeGeneratorApp:
             self.status_var.set(f"Bold skills file selected: {os.path.basename(file_path)}")
     
     def load_bold_skills(self, file_path):
-        """Load bold skills from JSON file"""
+        """Load bold skills from JSON file (safe to call from worker threads)"""
         try:
             if not file_path or not os.path.exists(file_path):
                 return []
@@ -297,10 +1125,10 @@ class ResumeGeneratorApp:
                 if 'skills' in data and isinstance(data['skills'], list):
                     return data['skills']
                 else:
-                    messagebox.showwarning("Warning", "Bold skills JSON file should contain a 'skills' array")
+                    self.post_ui_event('warning', "Warning", "Bold skills JSON file should contain a 'skills' array")
                     return []
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to load bold skills file: {str(e)}")
+            self.post_ui_event('error', "Error", f"Failed to load bold skills file: {str(e)}")
             return []
     
     def load_json_file(self):
@@ -319,6 +1147,11 @@ class ResumeGeneratorApp:
                     # Update filename based on title in JSON
                     self.update_filename_from_json(json_data)
                     
+                    try:
+                        self.get_resume_store().add_source(json_data, file_path)
+                    except Exception as e:
+                        print(f"❌ Failed to store resume source: {e}")
+                    
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to load JSON file: {str(e)}")
                 self.status_var.set("Error loading file")
@@ -327,15 +1160,7 @@ class ResumeGeneratorApp:
         """Update filename based on title from JSON data"""
         try:
             data = json.loads(json_data)
-            title = data.get('title', '').strip()
-            
-            if title:
-                # Clean title for filename (remove special characters)
-                clean_title = re.sub(r'[^\w\s-]', '', title)
-                clean_title = re.sub(r'[\s]+', '_', clean_title)
-                new_filename = f"Yallaiah_{clean_title}"
-            else:
-                new_filename = "Yallaiah_Senior_Data_Engineer"
+            new_filename = self.build_filename_from_title(data.get('title', ''))
             
             self.filename_var.set(new_filename)
             self.status_var.set(f"Filename updated to: {new_filename}")
@@ -346,6 +1171,42 @@ class ResumeGeneratorApp:
         except Exception as e:
             print(f"Error updating filename: {e}")
     
+    def get_skill_index(self, output_dir):
+        """Return the shared SkillIndex stored in output_dir"""
+        index_path = os.path.normcase(os.path.abspath(os.path.join(output_dir, SkillIndex.INDEX_FILENAME)))
+        with self.skill_indexes_lock:
+            if index_path not in self.skill_indexes:
+                self.skill_indexes[index_path] = SkillIndex(index_path)
+            return self.skill_indexes[index_path]
+    
+    def claim_unique_filename(self, title, used_filenames):
+        """Build the filename for title, suffixing _2, _3, ... past names in used_filenames, and claim it"""
+        base_filename = self.build_filename_from_title(title)
+        filename = base_filename
+        counter = 2
+        while filename in used_filenames:
+            filename = f"{base_filename}_{counter}"
+            counter += 1
+        used_filenames.add(filename)
+        return filename
+    
+    def get_resume_store(self):
+        """Return the shared ResumeStore, opening the catalog database on first use"""
+        with self.resume_store_lock:
+            if self.resume_store is None:
+                self.resume_store = ResumeStore(self.resume_store_path)
+            return self.resume_store
+    
+    def build_filename_from_title(self, title):
+        """Build the output filename from a resume title"""
+        title = title.strip()
+        if not title:
+            return "Yallaiah_Senior_Data_Engineer"
+        # Clean title for filename (remove special characters)
+        clean_title = re.sub(r'[^\w\s-]', '', title)
+        clean_title = re.sub(r'[\s]+', '_', clean_title)
+        return f"Yallaiah_{clean_title}"
+    
     def clear_fields(self):
         self.json_text.delete(1.0, tk.END)
         self.filename_var.set("Yallaiah_Senior_Data_Engineer")
@@ -359,19 +1220,26 @@ class ResumeGeneratorApp:
         """Try multiple methods to convert DOCX to PDF"""
         pdf_path = os.path.splitext(docx_path)[0] + ".pdf"
         
-        # Method 1: Try MS Word COM automation (if available)
+        # Method 1: Try MS Word COM automation (if available), reusing a warm instance when this thread has one
+        warm_word = getattr(converter_state, 'word', None)
         try:
             import win32com.client
-            word = win32com.client.Dispatch("Word.Application")
-            word.Visible = False
+            if warm_word is not None:
+                word = warm_word
+            else:
+                word = win32com.client.Dispatch("Word.Application")
+                word.Visible = False
             doc = word.Documents.Open(docx_path)
             doc.SaveAs(pdf_path, FileFormat=17)  # 17 = wdFormatPDF
             doc.Close()
-            word.Quit()
+            if warm_word is None:
+                word.Quit()
             print(f"✅ PDF created using MS Word COM: {pdf_path}")
             return True, pdf_path
         except Exception as e:
             print(f"❌ MS Word COM failed: {e}")
+            # A failed warm instance is dropped so the next conversion starts fresh
+            converter_state.word = None
             try:
                 word.Quit()
             except:
@@ -440,39 +1308,16 @@ class ResumeGeneratorApp:
         print("❌ All PDF conversion methods failed")
         return False, None
     
-    def make_text_bold_for_skills(self, paragraph, text, bold_skills, font_name, font_size):
-        """Add text to paragraph with bold formatting for matching skills"""
-        if not bold_skills or not text:
-            # If no bold skills or empty text, add normal text
-            run = paragraph.add_run(text)
-            run.font.name = font_name
-            run.font.size = Pt(font_size)
-            return
-        
-        # Create a case-insensitive pattern for whole word matching
-        # Sort skills by length (longest first) to avoid partial matches
-        sorted_skills = sorted(bold_skills, key=len, reverse=True)
-        
-        # Create pattern that matches whole words only
-        skill_patterns = []
-        for skill in sorted_skills:
-            # Escape special regex characters and create word boundary pattern
-            escaped_skill = re.escape(skill)
-            skill_patterns.append(f"\\b{escaped_skill}\\b")
-        
-        if not skill_patterns:
-            run = paragraph.add_run(text)
-            run.font.name = font_name
-            run.font.size = Pt(font_size)
-            return
-        
-        # Combine all patterns with OR
-        pattern = "|".join(skill_patterns)
-        
-        # Find all matches
-        matches = list(re.finditer(pattern, text, re.IGNORECASE))
+    def make_text_bold_for_skills(self, paragraph, text, bold_skills, font_name, font_size, spans=None):
+        """Add text to paragraph with bold formatting for matching skills (or precomputed HighlightIndex spans)"""
+        if spans is None:
+            if bold_skills and text:
+                matches = compile_skill_pattern(bold_skills).finditer(text)
+                spans = [match.span() for match in matches]
+            else:
+                spans = []
         
-        if not matches:
+        if not spans or not text:
             # No matches found, add normal text
             run = paragraph.add_run(text)
             run.font.name = font_name
@@ -482,8 +1327,8 @@ class ResumeGeneratorApp:
         # Process text with matches
         last_end = 0
         
-        for match in matches:
-            start, end = match.span()
+        for span in spans:
+            start, end = span[0], span[1]
             
             # Add text before match (normal)
             if start > last_end:
@@ -513,6 +1358,33 @@ class ResumeGeneratorApp:
     
     def generate_resume_threaded(self):
         """Run resume generation in a separate thread to prevent UI freezing"""
+        # Snapshot every input on the main thread; the worker never reads widgets
+        inputs = {
+            'json_string': self.json_text.get(1.0, tk.END).strip(),
+            'filename': self.filename_var.get().strip(),
+            'output_dir': self.output_dir_var.get().strip(),
+            'format': self.format_var.get(),
+            'font': self.font_var.get(),
+            'font_size': int(self.font_size_var.get()),
+            'bold_skills_path': self.bold_skills_var.get().strip(),
+            'export_spans': self.export_spans_var.get(),
+        }
+        
+        if not inputs['json_string']:
+            messagebox.showerror("Error", "Please provide JSON resume data")
+            self.status_var.set("Error: No JSON data provided")
+            return
+        
+        if not inputs['filename']:
+            messagebox.showerror("Error", "Please specify a filename")
+            self.status_var.set("Error: No filename specified")
+            return
+        
+        if not inputs['output_dir']:
+            messagebox.showerror("Error", "Please specify an output directory")
+            self.status_var.set("Error: No output directory specified")
+            return
+        
         # Change button style to processing (orange)
         self.generate_button.configure(style='Processing.TButton')
         self.generate_button.configure(text="⏳ Processing...")
@@ -520,57 +1392,733 @@ class ResumeGeneratorApp:
         self.progress.start(10)
         self.status_var.set("Generating resume...")
         
-        thread = threading.Thread(target=self.generate_resume)
+        thread = threading.Thread(target=self.generate_resume, args=(inputs,))
         thread.daemon = True
         thread.start()
     
-    def reset_generate_button(self):
-        """Reset generate button to original state"""
-        self.generate_button.configure(style='Success.TButton')
-        self.generate_button.configure(text="🚀 Generate Resume")
-        self.progress.stop()
+    def open_batch_panel(self):
+        """Open the batch queue panel for generating many resumes at once"""
+        if self.batch_window is not None and self.batch_window.winfo_exists():
+            self.batch_window.lift()
+            return
+        
+        window = tk.Toplevel(self.root)
+        window.title("Batch Queue")
+        window.geometry("950x500")
+        window.configure(bg='#2c3e50')
+        window.protocol("WM_DELETE_WINDOW", self.close_batch_panel)
+        self.batch_window = window
+        
+        frame = ttk.Frame(window, padding="15")
+        frame.pack(fill=tk.BOTH, expand=True)
+        
+        # Controls
+        controls = ttk.Frame(frame)
+        controls.pack(fill=tk.X, pady=(0, 10))
+        
+        ttk.Button(controls, text="➕ Add JSON Files", command=self.add_batch_files).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Button(controls, text="▶️ Start", command=self.start_batch,
+                   style='Success.TButton').pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Button(controls, text="⛔ Cancel Selected", command=self.cancel_batch_items,
+                   style='Danger.TButton').pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Button(controls, text="🔁 Retry Selected", command=self.retry_batch_items).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Button(controls, text="🧹 Clear Finished", command=self.clear_finished_batch_items).pack(side=tk.LEFT, padx=(0, 10))
+        
+        self.batch_workers_var = tk.StringVar(value="2")
+        ttk.Spinbox(controls, from_=1, to=8, textvariable=self.batch_workers_var,
+                    state="readonly", width=4).pack(side=tk.RIGHT)
+        ttk.Label(controls, text="Workers:").pack(side=tk.RIGHT, padx=(0, 10))
+        
+        # Item list
+        tree_frame = ttk.Frame(frame)
+        tree_frame.pack(fill=tk.BOTH, expand=True)
+        
+        columns = ("file", "status", "render", "save", "convert", "total")
+        self.batch_tree = ttk.Treeview(tree_frame, columns=columns, show='headings', selectmode='extended')
+        for column, heading, width in [("file", "File", 300), ("status", "Status", 220), ("render", "Render", 80),
+                                       ("save", "Save", 80), ("convert", "Convert", 80), ("total", "Total", 80)]:
+            self.batch_tree.heading(column, text=heading)
+            self.batch_tree.column(column, width=width, anchor=tk.W if column in ("file", "status") else tk.E)
+        
+        tree_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.batch_tree.yview)
+        tree_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.batch_tree.pack(fill=tk.BOTH, expand=True)
+        self.batch_tree.config(yscrollcommand=tree_scrollbar.set)
+        
+        # Progress and throughput
+        progress_frame = ttk.Frame(frame)
+        progress_frame.pack(fill=tk.X, pady=(10, 0))
+        
+        self.batch_stats_var = tk.StringVar(value="Add JSON files to start a batch")
+        ttk.Label(progress_frame, textvariable=self.batch_stats_var,
+                  font=('Segoe UI', 9), foreground='#7f8c8d').pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.batch_progress = ttk.Progressbar(progress_frame, mode='determinate', length=300, maximum=100)
+        self.batch_progress.pack(side=tk.RIGHT, padx=(10, 0))
+        
+        for item in self.batch_items.values():
+            self.batch_tree.insert('', tk.END, iid=item.item_id, values=self.batch_row_values(item))
+        
+        self.root.after(100, self.poll_batch_events, self.batch_events)
+    
+    def close_batch_panel(self):
+        """Cancel outstanding work and close the batch panel"""
+        for item in self.batch_items.values():
+            item.cancel_event.set()
+        if self.batch_executor is not None:
+            executor = self.batch_executor
+            executor.shutdown(wait=False, cancel_futures=True)
+            self.batch_executor = None
+            # Save what finished before the cancel once the workers have wound down
+            threading.Thread(target=lambda: (executor.shutdown(wait=True), self.save_skill_indexes())).start()
+        self.batch_items = {}
+        self.batch_filenames = set()
+        # Workers still winding down keep posting to the old queue, which nothing reads any more
+        self.batch_events = queue.Queue()
+        self.batch_window.destroy()
+        self.batch_window = None
+    
+    def batch_row_values(self, item):
+        status = f"{item.status}: {item.error}" if item.error else item.status
+        timings = [f"{item.timings[stage]:.2f}s" if stage in item.timings else ""
+                   for stage in ("render", "save", "convert", "total")]
+        return (os.path.basename(item.json_path), status, *timings)
     
-    def generate_resume(self):
-        json_string = self.json_text.get(1.0, tk.END).strip()
-        filename = self.filename_var.get().strip()
-        output_dir = self.output_dir_var.get().strip()
-        selected_format = self.format_var.get()
-        selected_font = self.font_var.get()
-        font_size = int(self.font_size_var.get())
+    def set_batch_status(self, item, status, timings=None, error=None):
+        item.status = status
+        item.error = error
+        if timings is not None:
+            item.timings = timings
+        if self.batch_window is not None:
+            self.batch_tree.item(item.item_id, values=self.batch_row_values(item))
+    
+    def add_batch_files(self):
+        json_paths = filedialog.askopenfilenames(
+            parent=self.batch_window,
+            title="Select JSON Resume Files",
+            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+        )
+        for json_path in json_paths:
+            item_id = self.batch_tree.insert('', tk.END, values=(os.path.basename(json_path), "Pending", "", "", "", ""))
+            self.batch_items[item_id] = BatchItem(item_id, json_path)
+        self.update_batch_stats()
+    
+    def start_batch(self):
+        """Queue every pending item on a bounded worker pool"""
+        pending = [item for item in self.batch_items.values() if item.status == "Pending"]
+        if not pending:
+            messagebox.showinfo("Batch Queue", "No pending items to generate", parent=self.batch_window)
+            return
+        
+        # Snapshot settings on the main thread; workers never read widgets
+        self.batch_settings = {
+            'output_dir': self.output_dir_var.get().strip(),
+            'format': self.format_var.get(),
+            'font': self.font_var.get(),
+            'font_size': int(self.font_size_var.get()),
+            'export_spans': self.export_spans_var.get(),
+        }
+        if not self.batch_settings['output_dir']:
+            messagebox.showerror("Error", "Please specify an output directory", parent=self.batch_window)
+            return
         bold_skills_path = self.bold_skills_var.get().strip()
+        self.batch_bold_skills = self.load_bold_skills(bold_skills_path) if bold_skills_path else []
         
-        if not json_string:
-            self.reset_generate_button()
-            messagebox.showerror("Error", "Please provide JSON resume data")
-            self.status_var.set("Error: No JSON data provided")
+        if not self.batch_is_running():
+            self.begin_batch_run()
+        self.validate_batch_items(pending)
+        self.update_batch_stats()
+    
+    def begin_batch_run(self):
+        """Reset throughput stats and start a worker pool sized from the Workers spinbox; only call while idle"""
+        self.batch_started_at = time.monotonic()
+        self.batch_completed = 0
+        if self.batch_executor is not None:
+            # The previous run is idle, so its pool only has to finish any pending index save
+            self.batch_executor.shutdown(wait=False)
+        self.batch_executor = ThreadPoolExecutor(max_workers=int(self.batch_workers_var.get()),
+                                                 thread_name_prefix="resume-batch")
+    
+    def validate_batch_items(self, items):
+        """Pre-flight items off the Tk thread; the results come back through batch_events as Validated or Failed"""
+        for item in items:
+            item.timings = {}
+            self.set_batch_status(item, "Validating")
+        events = self.batch_events
+        json_paths = [item.json_path for item in items]
+        
+        def preflight():
+            try:
+                invalid = validate_resume_batch(json_paths)
+            except Exception as e:
+                invalid = {json_path: [str(e)] for json_path in json_paths}
+            for item in items:
+                if item.json_path in invalid:
+                    events.put((item.item_id, "Failed", {}, invalid[item.json_path][0]))
+                else:
+                    events.put((item.item_id, "Validated", {}, None))
+        
+        threading.Thread(target=preflight, daemon=True).start()
+    
+    def submit_batch_item(self, item):
+        item.cancel_event = threading.Event()
+        item.timings = {}
+        self.set_batch_status(item, "Queued")
+        item.future = self.batch_executor.submit(self.run_batch_item, item, self.batch_settings, self.batch_bold_skills,
+                                                 self.batch_events)
+    
+    def batch_is_running(self):
+        return any(item.status not in ("Pending", "Done", "Failed", "Cancelled") for item in self.batch_items.values())
+    
+    def cancel_batch_items(self):
+        for item_id in self.batch_tree.selection():
+            item = self.batch_items[item_id]
+            if item.status in ("Pending", "Validating"):
+                self.set_batch_status(item, "Cancelled")
+            elif item.status == "Queued" and item.future is not None and item.future.cancel():
+                self.set_batch_status(item, "Cancelled")
+            elif item.status not in ("Done", "Failed", "Cancelled"):
+                item.cancel_event.set()
+                self.set_batch_status(item, "Cancelling", item.timings)
+        self.update_batch_stats()
+    
+    def retry_batch_items(self):
+        retry = []
+        for item_id in self.batch_tree.selection():
+            item = self.batch_items[item_id]
+            if item.status in ("Failed", "Cancelled"):
+                retry.append(item)
+        if retry and self.batch_executor is not None and self.batch_settings is not None:
+            if not self.batch_is_running():
+                self.begin_batch_run()
+            self.validate_batch_items(retry)
+        else:
+            for item in retry:
+                self.set_batch_status(item, "Pending", {})
+        self.update_batch_stats()
+    
+    def clear_finished_batch_items(self):
+        for item_id, item in list(self.batch_items.items()):
+            if item.status == "Done":
+                self.batch_tree.delete(item_id)
+                del self.batch_items[item_id]
+        self.update_batch_stats()
+    
+    def run_batch_item(self, item, settings, bold_skills, events):
+        """Worker side of the batch queue; reports progress only through the events queue of its panel session"""
+        if item.cancel_event.is_set():
+            events.put((item.item_id, "Cancelled", {}, None))
             return
         
-        if not filename:
-            self.reset_generate_button()
-            messagebox.showerror("Error", "Please specify a filename")
-            self.status_var.set("Error: No filename specified")
+        timings = {}
+        start = time.perf_counter()
+        
+        def publish(status, error=None):
+            timings['total'] = round(time.perf_counter() - start, 4)
+            events.put((item.item_id, status, dict(timings), error))
+        
+        try:
+            # validate_batch_items already checked the file before it was queued
+            with open(item.json_path, 'r', encoding='utf-8') as f:
+                json_string = f.read()
+            
+            # Keep output names unique across the batch; retries reuse their name
+            with self.batch_lock:
+                if item.filename is None:
+                    item.filename = self.claim_unique_filename(json.loads(json_string).get('title', ''),
+                                                               self.batch_filenames)
+            
+            if self.has_current_output(json_string, item, settings, bold_skills):
+                publish("Done", "unchanged, kept catalogued output")
+                return
+            
+            success = self.generate_resume_from_json(json_string, item.filename, settings['output_dir'], settings['format'],
+                                                     settings['font'], settings['font_size'], bold_skills,
+                                                     timings=timings, source=item.json_path, export_spans=settings['export_spans'],
+                                                     on_stage=publish, cancel_event=item.cancel_event)
+            if item.cancel_event.is_set():
+                publish("Cancelled")
+            elif success:
+                publish("Done")
+            else:
+                publish("Failed", "generation failed, see console")
+        except Exception as e:
+            publish("Failed", str(e))
+    
+    def has_current_output(self, json_string, item, settings, bold_skills):
+        """True if identical source, skills, font and format were already rendered and are still on disk"""
+        # The catalog doesn't track spans files, so a spans export always renders
+        if settings['export_spans']:
+            return False
+        try:
+            store = self.get_resume_store()
+            source_id = store.add_source(json_string, item.json_path)
+            cached = store.find_current_artifacts(source_id, item.filename, skills_profile(bold_skills), settings['font'],
+                                                  settings['font_size'], settings['format'], settings['output_dir'])
+            if not cached:
+                return False
+            # Skipping must not leave the skill index without this resume
+            return self.get_skill_index(settings['output_dir']).knows(item.filename, item.json_path)
+        except Exception as e:
+            print(f"❌ Catalog lookup failed, rendering {item.json_path}: {e}")
+            return False
+    
+    def poll_batch_events(self, events):
+        """Drain worker events on the Tk main loop and refresh the panel"""
+        # A poll loop from a closed panel session stops once its queue has been replaced
+        if self.batch_window is None or events is not self.batch_events:
             return
         
-        if not output_dir:
-            self.reset_generate_button()
-            messagebox.showerror("Error", "Please specify an output directory")
-            self.status_var.set("Error: No output directory specified")
+        finished_any = False
+        while True:
+            try:
+                item_id, status, timings, error = events.get_nowait()
+            except queue.Empty:
+                break
+            item = self.batch_items.get(item_id)
+            if item is None:
+                continue
+            # Pre-flight results only apply to items still waiting on them, not ones cancelled meanwhile
+            if item.status == "Validating":
+                if status == "Validated":
+                    self.submit_batch_item(item)
+                    continue
+            elif status == "Validated" or (status == "Failed" and item.status == "Cancelled"):
+                continue
+            # A cancel request keeps showing until the worker reaches a final state
+            if item.status == "Cancelling" and status not in ("Done", "Failed", "Cancelled"):
+                status = "Cancelling"
+            if status in ("Done", "Failed", "Cancelled"):
+                self.batch_completed += 1
+                finished_any = True
+            self.set_batch_status(item, status, timings, error)
+        
+        # Persist the skill index once per batch rather than once per resume
+        if finished_any and not self.batch_is_running() and self.batch_executor is not None:
+            self.batch_executor.submit(self.save_skill_indexes)
+        
+        self.update_batch_stats()
+        self.root.after(100, self.poll_batch_events, events)
+    
+    def update_batch_stats(self):
+        items = list(self.batch_items.values())
+        if not items:
+            self.batch_progress['value'] = 0
+            self.batch_stats_var.set("Add JSON files to start a batch")
             return
         
+        finished = sum(1 for item in items if item.status in ("Done", "Failed", "Cancelled"))
+        done = sum(1 for item in items if item.status == "Done")
+        failed = sum(1 for item in items if item.status == "Failed")
+        remaining = sum(1 for item in items if item.status not in ("Pending", "Done", "Failed", "Cancelled"))
+        self.batch_progress['value'] = finished * 100 / len(items)
+        
+        stats = f"{finished}/{len(items)} finished · {done} done · {failed} failed"
+        if self.batch_started_at is not None and self.batch_completed:
+            elapsed = time.monotonic() - self.batch_started_at
+            rate = self.batch_completed / elapsed if elapsed > 0 else 0
+            stats += f" · {rate:.2f} items/s"
+            if remaining and rate > 0:
+                stats += f" · ETA {remaining / rate:.0f}s"
+        self.batch_stats_var.set(stats)
+    
+    def open_catalog_panel(self):
+        """Open the generated-resume catalog search window"""
+        if self.catalog_window is not None and self.catalog_window.winfo_exists():
+            self.catalog_window.lift()
+            return
+        
+        window = tk.Toplevel(self.root)
+        window.title("Resume Catalog")
+        window.geometry("1000x500")
+        window.configure(bg='#2c3e50')
+        self.catalog_window = window
+        
+        frame = ttk.Frame(window, padding="15")
+        frame.pack(fill=tk.BOTH, expand=True)
+        
+        # Filters
+        filters = ttk.Frame(frame)
+        filters.pack(fill=tk.X, pady=(0, 10))
+        
+        ttk.Label(filters, text="Title:").pack(side=tk.LEFT, padx=(0, 5))
+        self.catalog_title_var = tk.StringVar()
+        ttk.Entry(filters, textvariable=self.catalog_title_var, width=25).pack(side=tk.LEFT, padx=(0, 10))
+        
+        ttk.Label(filters, text="Font:").pack(side=tk.LEFT, padx=(0, 5))
+        self.catalog_font_var = tk.StringVar()
+        ttk.Combobox(filters, textvariable=self.catalog_font_var, values=[""] + self.font_styles,
+                     state="readonly", width=16).pack(side=tk.LEFT, padx=(0, 10))
+        
+        ttk.Label(filters, text="Size:").pack(side=tk.LEFT, padx=(0, 5))
+        self.catalog_size_var = tk.StringVar()
+        ttk.Combobox(filters, textvariable=self.catalog_size_var, values=['', '9', '10', '11', '12', '13', '14'],
+                     state="readonly", width=5).pack(side=tk.LEFT, padx=(0, 10))
+        
+        ttk.Label(filters, text="Since (YYYY-MM-DD):").pack(side=tk.LEFT, padx=(0, 5))
+        self.catalog_since_var = tk.StringVar()
+        ttk.Entry(filters, textvariable=self.catalog_since_var, width=12).pack(side=tk.LEFT, padx=(0, 10))
+        
+        ttk.Button(filters, text="🔎 Search", command=self.search_catalog).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Button(filters, text="📝 Load Into Editor", command=self.load_catalog_source).pack(side=tk.RIGHT)
+        
+        # Results
+        tree_frame = ttk.Frame(frame)
+        tree_frame.pack(fill=tk.BOTH, expand=True)
+        
+        columns = ("created", "title", "font", "kind", "path", "render", "convert")
+        self.catalog_tree = ttk.Treeview(tree_frame, columns=columns, show='headings', selectmode='browse')
+        for column, heading, width in [("created", "Created", 140), ("title", "Title", 180), ("font", "Font", 110),
+                                       ("kind", "Type", 50), ("path", "Path", 350), ("render", "Render", 70),
+                                       ("convert", "Convert", 70)]:
+            self.catalog_tree.heading(column, text=heading)
+            self.catalog_tree.column(column, width=width, anchor=tk.E if column in ("render", "convert") else tk.W)
+        
+        tree_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.catalog_tree.yview)
+        tree_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.catalog_tree.pack(fill=tk.BOTH, expand=True)
+        self.catalog_tree.config(yscrollcommand=tree_scrollbar.set)
+        
+        self.catalog_source_ids = {}
+        self.search_catalog()
+    
+    def search_catalog(self):
+        try:
+            rows = self.get_resume_store().query_artifacts(
+                title=self.catalog_title_var.get().strip() or None,
+                font_name=self.catalog_font_var.get() or None,
+                font_size=self.catalog_size_var.get() or None,
+                since=self.catalog_since_var.get().strip() or None)
+        except Exception as e:
+            messagebox.showerror("Error", f"Catalog query failed: {str(e)}", parent=self.catalog_window)
+            return
+        
+        self.catalog_tree.delete(*self.catalog_tree.get_children())
+        self.catalog_source_ids = {}
+        for row in rows:
+            item_id = self.catalog_tree.insert('', tk.END, values=(
+                row['created_at'].replace('T', ' '), row['title'] or "", f"{row['font_name']} {row['font_size']}",
+                row['kind'].upper(), row['path'],
+                f"{row['render_seconds']:.2f}s" if row['render_seconds'] is not None else "",
+                f"{row['convert_seconds']:.2f}s" if row['convert_seconds'] is not None else ""))
+            self.catalog_source_ids[item_id] = (row['source_id'], row['filename'])
+    
+    def load_catalog_source(self):
+        """Load the JSON source of the selected catalog entry into the editor for re-rendering"""
+        selection = self.catalog_tree.selection()
+        if not selection:
+            return
+        source_id, filename = self.catalog_source_ids[selection[0]]
+        source = self.get_resume_store().get_source(source_id)
+        self.json_text.delete(1.0, tk.END)
+        self.json_text.insert(tk.END, source['json'])
+        self.filename_var.set(filename)
+        self.status_var.set(f"Loaded from catalog: {filename}")
+    
+    def generate_bundle_threaded(self):
+        """Pick several JSON files and stream their outputs into one ZIP/TAR bundle"""
+        json_paths = filedialog.askopenfilenames(
+            title="Select JSON Resume Files",
+            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+        )
+        if not json_paths:
+            return
+        
+        bundle_path = filedialog.asksaveasfilename(
+            title="Save Bundle As",
+            initialdir=self.output_dir_var.get(),
+            defaultextension=".zip",
+            filetypes=[("ZIP archive", "*.zip"), ("TAR archive", "*.tar.gz *.tgz *.tar"), ("All files", "*.*")]
+        )
+        if not bundle_path:
+            return
+        
+        archive_format = "tar" if bundle_path.lower().endswith((".tar", ".tar.gz", ".tgz")) else "zip"
+        compression_level = int(self.bundle_level_var.get())
+        
+        self.generate_button.configure(style='Processing.TButton')
+        self.generate_button.configure(text="⏳ Processing...")
+        self.progress.start(10)
+        self.status_var.set(f"Bundling {len(json_paths)} resumes...")
+        
+        settings = {
+            'format': self.format_var.get(),
+            'font': self.font_var.get(),
+            'font_size': int(self.font_size_var.get()),
+            'bold_skills_path': self.bold_skills_var.get().strip(),
+            'export_spans': self.export_spans_var.get(),
+        }
+        thread = threading.Thread(target=self.generate_bundle,
+                                  args=(list(json_paths), bundle_path, archive_format, compression_level, settings))
+        thread.daemon = True
+        thread.start()
+    
+    def generate_bundle(self, json_paths, bundle_path, archive_format, compression_level, settings):
+        try:
+            # Pre-flight validation so no conversion time is spent on inputs bound to fail
+            self.post_ui_event('status', f"Validating {len(json_paths)} resumes...")
+            invalid = validate_resume_batch(json_paths)
+            if invalid:
+                self.post_ui_event('finished')
+                self.post_ui_event('status', f"❌ Validation failed for {len(invalid)} file(s), nothing was rendered")
+                self.post_ui_event('validation', invalid)
+                return
+            
+            bold_skills_path = settings['bold_skills_path']
+            bold_skills = self.load_bold_skills(bold_skills_path) if bold_skills_path else []
+            results = self.generate_batch_bundle(json_paths, bundle_path, settings['format'], settings['font'],
+                                                 settings['font_size'], bold_skills, archive_format, compression_level,
+                                                 export_spans=settings['export_spans'])
+            self.post_ui_event('finished')
+            
+            failed = [os.path.basename(path) for path, success in results if not success]
+            if failed:
+                self.post_ui_event('status', f"⚠️ Bundle saved with {len(failed)} failure(s)")
+                self.post_ui_event('warning', "Warning", f"Bundle saved to: {bundle_path}\nFailed: {', '.join(failed)}")
+            else:
+                self.post_ui_event('status', "✅ Bundle generated successfully!")
+                self.post_ui_event('info', "Success", f"{len(results)} resumes bundled successfully!\nBundle saved to: {bundle_path}")
+        except Exception as e:
+            self.post_ui_event('finished')
+            self.post_ui_event('status', f"Error: {str(e)}")
+            self.post_ui_event('error', "Error", f"An error occurred: {str(e)}")
+    
+    def show_validation_errors(self, invalid):
+        """Show validation errors grouped by file"""
+        lines = []
+        for errors in invalid.values():
+            lines.extend(errors)
+        # Keep the dialog a sensible size for large batches
+        if len(lines) > 25:
+            lines = lines[:25] + [f"... and {len(lines) - 25} more"]
+        for line in lines:
+            print(f"❌ {line}")
+        messagebox.showerror("Validation Error", "\n".join(lines))
+    
+    def toggle_watch_mode(self):
+        """Start or stop watching an input directory and the bold skills file"""
+        if self.watcher is not None:
+            self.stop_watch_mode()
+            return
+        
+        input_dir = filedialog.askdirectory(
+            initialdir=self.output_dir_var.get(),
+            title="Select Resume JSON Directory to Watch"
+        )
+        if not input_dir:
+            return
+        
+        # Settings are captured once; restart watch mode to apply changes
+        settings = {
+            'output_dir': self.output_dir_var.get().strip(),
+            'format': self.format_var.get(),
+            'font': self.font_var.get(),
+            'font_size': int(self.font_size_var.get()),
+            'bold_skills_path': self.bold_skills_var.get().strip(),
+            'export_spans': self.export_spans_var.get(),
+        }
+        
+        self.watch_queue = queue.Queue()
+        self.watcher = ResumeWatcher(input_dir, settings['bold_skills_path'], self.watch_queue.put)
+        worker = threading.Thread(target=self.run_watch_worker, args=(self.watch_queue, input_dir, settings))
+        worker.daemon = True
+        worker.start()
+        self.watcher.start()
+        
+        self.watch_button.configure(text="⏹️ Stop Watch", style='Processing.TButton')
+        self.status_var.set(f"👁️ Watching {input_dir} ({self.watcher.mode})")
+    
+    def stop_watch_mode(self):
+        self.watcher.stop()
+        self.watch_queue.put(None)
+        self.watcher = None
+        self.watch_queue = None
+        self.watch_button.configure(text="👁️ Watch", style='TButton')
+        self.status_var.set("Watch mode stopped")
+    
+    def start_warm_converter(self):
+        """Keep one MS Word instance open for this thread's conversions"""
+        try:
+            import pythoncom
+            import win32com.client
+            pythoncom.CoInitialize()
+            word = win32com.client.Dispatch("Word.Application")
+            word.Visible = False
+            converter_state.word = word
+            print("✅ MS Word kept warm for conversions")
+        except Exception as e:
+            print(f"❌ Could not keep MS Word warm: {e}")
+    
+    def stop_warm_converter(self):
+        word = getattr(converter_state, 'word', None)
+        converter_state.word = None
+        if word is not None:
+            try:
+                word.Quit()
+            except:
+                pass
+        try:
+            import pythoncom
+            pythoncom.CoUninitialize()
+        except:
+            pass
+    
+    def run_watch_worker(self, watch_queue, input_dir, settings):
+        """Regenerate outputs for changed files until watch mode is stopped"""
+        bold_skills_path = settings['bold_skills_path']
+        skills_key = os.path.normcase(os.path.abspath(bold_skills_path)) if bold_skills_path else None
+        self.start_warm_converter()
+        try:
+            bold_skills = self.load_bold_skills(bold_skills_path) if bold_skills_path else []
+            # Each watched file keeps one output name; start from the names already indexed in output_dir
+            watch_filenames = {os.path.normcase(os.path.abspath(entry['source'])): resume
+                               for resume, entry in self.get_skill_index(settings['output_dir']).resumes.items()
+                               if entry.get('source')}
+            used_filenames = set(watch_filenames.values())
+            stopping = False
+            while not stopping:
+                changed = watch_queue.get()
+                if changed is None:
+                    break
+                changed = set(changed)
+                # Fold in anything that arrived while the previous batch was rendering
+                while True:
+                    try:
+                        more = watch_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if more is None:
+                        stopping = True
+                        break
+                    changed |= more
+                
+                json_paths = {path for path in changed if path != skills_key}
+                if skills_key in changed:
+                    bold_skills = self.load_bold_skills(bold_skills_path)
+                    json_paths.update(self.resumes_to_rebuild(input_dir, settings['output_dir'], bold_skills, skills_key))
+                
+                for json_path in sorted(json_paths):
+                    if stopping:
+                        break
+                    if os.path.exists(json_path):
+                        self.regenerate_watched_resume(json_path, settings, bold_skills, watch_filenames, used_filenames)
+                self.save_skill_indexes()
+        except Exception as e:
+            print(f"❌ Watch worker error: {e}")
+            self.post_ui_event('status', f"Error: {str(e)}")
+        finally:
+            self.stop_warm_converter()
+    
+    def resumes_to_rebuild(self, input_dir, output_dir, new_skills, skills_key=None):
+        """Resolve a bold keyword change to the resume JSON files in input_dir that need re-rendering"""
+        skill_index = self.get_skill_index(output_dir)
+        affected_sources = {os.path.normcase(os.path.abspath(source))
+                            for source in skill_index.resumes_affected_by_skills(new_skills).values()
+                            if source}
+        indexed_sources = {os.path.normcase(os.path.abspath(entry['source']))
+                           for entry in skill_index.resumes.values() if entry.get('source')}
+        
+        json_paths = set()
+        for name in os.listdir(input_dir):
+            path = os.path.normcase(os.path.abspath(os.path.join(input_dir, name)))
+            if not is_resume_json_name(name) or path == skills_key:
+                continue
+            # Files never rendered into this output dir have no index entry, so build them too
+            if path in affected_sources or path not in indexed_sources:
+                json_paths.add(path)
+        print(f"✅ Keyword change affects {len(json_paths)} resume(s)")
+        return json_paths
+    
+    def regenerate_watched_resume(self, json_path, settings, bold_skills, watch_filenames, used_filenames):
+        file_name = os.path.basename(json_path)
+        errors = validate_resume_file(json_path)
+        if errors:
+            for error in errors:
+                print(f"❌ {error}")
+            self.post_ui_event('status', f"❌ {errors[0]}")
+            return False
+        
+        start = time.perf_counter()
+        with open(json_path, 'r', encoding='utf-8') as f:
+            json_string = f.read()
+        # Keep this file's suffixed name while its title is unchanged, so resumes sharing a title don't overwrite each other
+        title = json.loads(json_string).get('title', '')
+        filename = watch_filenames.get(json_path)
+        if filename is None or not re.fullmatch(re.escape(self.build_filename_from_title(title)) + r"(_\d+)?", filename):
+            used_filenames.discard(filename)
+            filename = self.claim_unique_filename(title, used_filenames)
+            watch_filenames[json_path] = filename
+        success = self.generate_resume_from_json(json_string, filename, settings['output_dir'], settings['format'],
+                                                 settings['font'], settings['font_size'], bold_skills, source=json_path,
+                                                 export_spans=settings['export_spans'])
+        elapsed = time.perf_counter() - start
+        if success:
+            self.post_ui_event('status', f"🔄 Regenerated {filename} from {file_name} in {elapsed:.1f}s")
+        else:
+            self.post_ui_event('status', f"❌ Failed to regenerate {file_name}")
+        return success
+    
+    def reset_generate_button(self):
+        """Reset generate button to original state"""
+        self.generate_button.configure(style='Success.TButton')
+        self.generate_button.configure(text="🚀 Generate Resume")
+        self.progress.stop()
+    
+    def post_ui_event(self, event, *args):
+        """Queue an event for the Tk main loop; safe to call from any thread"""
+        self.ui_events.put((event, args))
+    
+    def process_ui_events(self):
+        """Apply queued worker events on the Tk main loop"""
+        while True:
+            try:
+                event, args = self.ui_events.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                if event == 'status':
+                    self.status_var.set(args[0])
+                elif event == 'filename':
+                    self.filename_var.set(args[0])
+                elif event == 'finished':
+                    self.reset_generate_button()
+                elif event == 'validation':
+                    self.show_validation_errors(args[0])
+                elif event == 'info':
+                    messagebox.showinfo(*args)
+                elif event == 'warning':
+                    messagebox.showwarning(*args)
+                elif event == 'error':
+                    messagebox.showerror(*args)
+            except Exception as e:
+                print(f"❌ Failed to handle UI event {event}: {e}")
+        
+        self.root.after(50, self.process_ui_events)
+    
+    def generate_resume(self, inputs):
+        json_string = inputs['json_string']
+        filename = inputs['filename']
+        output_dir = inputs['output_dir']
+        bold_skills_path = inputs['bold_skills_path']
+        
         try:
             # Validate JSON and update filename
             json_data = json.loads(json_string)
             
+            schema_errors = validate_resume_data(json_data)
+            if schema_errors:
+                self.post_ui_event('finished')
+                self.post_ui_event('status', f"❌ Validation failed with {len(schema_errors)} error(s)")
+                self.post_ui_event('validation', {"Resume JSON": [f"{path}: {message}" for path, message in schema_errors]})
+                return
+            
             # Update filename based on title if not already done
             title = json_data.get('title', '').strip()
             if title and not filename.startswith(f"Yallaiah_{title.replace(' ', '_')}"):
-                clean_title = re.sub(r'[^\w\s-]', '', title)
-                clean_title = re.sub(r'[\s]+', '_', clean_title)
-                filename = f"Yallaiah_{clean_title}"
-                self.filename_var.set(filename)
+                filename = self.build_filename_from_title(title)
+                self.post_ui_event('filename', filename)
             elif not title and filename == self.default_filename:
                 filename = "Yallaiah_Senior_Data_Engineer"
-                self.filename_var.set(filename)
+                self.post_ui_event('filename', filename)
             
             # Load bold skills
             bold_skills = self.load_bold_skills(bold_skills_path) if bold_skills_path else []
@@ -579,288 +2127,347 @@ class ResumeGeneratorApp:
             os.makedirs(output_dir, exist_ok=True)
             
             # Generate resume with selected format and bold skills
-            success = self.generate_resume_from_json(json_string, filename, output_dir, selected_format, selected_font, font_size, bold_skills)
+            success = self.generate_resume_from_json(json_string, filename, output_dir, inputs['format'], inputs['font'],
+                                                     inputs['font_size'], bold_skills, export_spans=inputs['export_spans'],
+                                                     on_stage=lambda stage: self.post_ui_event('status', f"{stage} resume..."))
+            self.save_skill_indexes()
             
-            self.reset_generate_button()
+            self.post_ui_event('finished')
             
             if success:
-                messagebox.showinfo("Success", f"Resume generated successfully!\nFiles saved to: {output_dir}")
-                self.status_var.set("✅ Resume generated successfully!")
+                self.post_ui_event('status', "✅ Resume generated successfully!")
+                self.post_ui_event('info', "Success", f"Resume generated successfully!\nFiles saved to: {output_dir}")
             else:
-                messagebox.showerror("Error", "Failed to generate resume")
-                self.status_var.set("❌ Failed to generate resume")
+                self.post_ui_event('status', "❌ Failed to generate resume")
+                self.post_ui_event('error', "Error", "Failed to generate resume")
                 
         except json.JSONDecodeError:
-            self.reset_generate_button()
-            messagebox.showerror("Error", "Invalid JSON format")
-            self.status_var.set("Error: Invalid JSON format")
+            self.post_ui_event('finished')
+            self.post_ui_event('status', "Error: Invalid JSON format")
+            self.post_ui_event('error', "Error", "Invalid JSON format")
         except Exception as e:
-            self.reset_generate_button()
-            messagebox.showerror("Error", f"An error occurred: {str(e)}")
-            self.status_var.set(f"Error: {str(e)}")
+            self.post_ui_event('finished')
+            self.post_ui_event('status', f"Error: {str(e)}")
+            self.post_ui_event('error', "Error", f"An error occurred: {str(e)}")
     
-    def generate_resume_from_json(self, json_string, filename, output_dir, selected_format, font_name, font_size, bold_skills):
-        try:
-            data = json.loads(json_string)
-            
-            # Use the exact output directory specified (no date-based subdirectory)
-            os.makedirs(output_dir, exist_ok=True)
-            
-            # Determine file paths
-            docx_filename = f"{filename}.docx"
-            docx_path = os.path.join(output_dir, docx_filename)
-            
-            # Generate DOCX if needed
-            if selected_format in ["DOCX Only", "Both (DOCX + PDF)"]:
-                doc = Document()
-
-                # === Styling & Layout with dynamic font ===
-                section = doc.sections[0]
-                section.left_margin = Inches(0.5)
-                section.right_margin = Inches(0.5)
-                section.top_margin = Inches(0.4)
-                section.bottom_margin = Inches(0.4)
-
-                # Apply selected font style
-                style = doc.styles['Normal']
-                font = style.font
-                font.name = font_name
-                font.size = Pt(font_size)
-                style.paragraph_format.line_spacing = 1.0
-                style.paragraph_format.space_before = Pt(0)
-                style.paragraph_format.space_after = Pt(0)
-
-                def add_centered_paragraph(text, bold=False, size=None):
-                    if size is None:
-                        size = font_size
-                    p = doc.add_paragraph()
-                    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                    run = p.add_run(text)
-                    run.bold = bold
+    def build_resume_document(self, data, font_name, font_size, bold_skills, highlight_index=None):
+        """Build the resume Document from parsed JSON data"""
+        if highlight_index is None:
+            highlight_index = HighlightIndex(data, bold_skills)
+        
+        doc = Document()
+
+        # === Styling & Layout with dynamic font ===
+        section = doc.sections[0]
+        section.left_margin = Inches(0.5)
+        section.right_margin = Inches(0.5)
+        section.top_margin = Inches(0.4)
+        section.bottom_margin = Inches(0.4)
+
+        # Apply selected font style
+        style = doc.styles['Normal']
+        font = style.font
+        font.name = font_name
+        font.size = Pt(font_size)
+        style.paragraph_format.line_spacing = 1.0
+        style.paragraph_format.space_before = Pt(0)
+        style.paragraph_format.space_after = Pt(0)
+
+        def add_centered_paragraph(text, bold=False, size=None):
+            if size is None:
+                size = font_size
+            p = doc.add_paragraph()
+            p.alignment = WD_ALIGN_PARAGRAPH.CENTER
+            run = p.add_run(text)
+            run.bold = bold
+            run.font.name = font_name
+            run.font.size = Pt(size)
+            p.paragraph_format.space_after = Pt(2)
+
+        def add_section_heading(text):
+            p = doc.add_paragraph()
+            p.alignment = WD_ALIGN_PARAGRAPH.LEFT
+            run = p.add_run(text.upper())
+            run.bold = True
+            run.font.name = font_name
+            run.font.size = Pt(font_size)
+            run.font.color.rgb = RGBColor(0, 0, 0)
+            p_border = OxmlElement('w:pBdr')
+            bottom = OxmlElement('w:bottom')
+            bottom.set(qn('w:val'), 'single')
+            bottom.set(qn('w:sz'), '6')
+            bottom.set(qn('w:space'), '1')
+            bottom.set(qn('w:color'), '000000')
+            p_border.append(bottom)
+            p._p.get_or_add_pPr().append(p_border)
+            p.paragraph_format.space_after = Pt(4)
+
+        def add_bullet_points(items, field_path):
+            """Add bullet points with bold skills formatting"""
+            for index, item in enumerate(items):
+                p = doc.add_paragraph(style='List Bullet')
+                p.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
+                p.paragraph_format.space_after = Pt(2)
+                p.paragraph_format.left_indent = Inches(0.25)
+                
+                # Use the new function to add text with bold skills
+                self.make_text_bold_for_skills(p, item, bold_skills, font_name, font_size,
+                                               spans=highlight_index.spans_for(f"{field_path}[{index}]"))
+
+        def add_hyperlinked_paragraph(doc, text_parts):
+            paragraph = doc.add_paragraph()
+            paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
+            paragraph.paragraph_format.space_after = Pt(4)
+            for idx, (display_text, url) in enumerate(text_parts):
+                r_id = doc.part.relate_to(url, RELATIONSHIP_TYPE.HYPERLINK, is_external=True)
+                hyperlink = OxmlElement('w:hyperlink')
+                hyperlink.set(qn('r:id'), r_id)
+                new_run = OxmlElement('w:r')
+                rPr = OxmlElement('w:rPr')
+                
+                # Apply font to hyperlink
+                font_elem = OxmlElement('w:rFonts')
+                font_elem.set(qn('w:ascii'), font_name)
+                font_elem.set(qn('w:hAnsi'), font_name)
+                rPr.append(font_elem)
+                
+                color = OxmlElement('w:color')
+                color.set(qn('w:val'), '0000FF')
+                rPr.append(color)
+                underline = OxmlElement('w:u')
+                underline.set(qn('w:val'), 'single')
+                rPr.append(underline)
+                new_run.append(rPr)
+                text = OxmlElement('w:t')
+                text.text = display_text
+                new_run.append(text)
+                hyperlink.append(new_run)
+                paragraph._p.append(hyperlink)
+                if idx != len(text_parts) - 1:
+                    run = paragraph.add_run(" | ")
                     run.font.name = font_name
-                    run.font.size = Pt(size)
-                    p.paragraph_format.space_after = Pt(2)
 
-                def add_section_heading(text):
+        # === HEADER ===
+        add_centered_paragraph(data['name'], bold=True, size=font_size + 3)
+        add_centered_paragraph(data.get('title', ''), size=font_size)
+
+        contact = data.get('contact', {})
+        contact_parts = []
+        if contact.get('portfolio'):
+            contact_parts.append(('Portfolio', contact['portfolio']))
+        if contact.get('linkedin'):
+            contact_parts.append(('LinkedIn', contact['linkedin']))
+        if contact.get('email'):
+            contact_parts.append((contact['email'], f"mailto:{contact['email']}"))
+        if contact.get('phone'):
+            contact_parts.append((contact['phone'], f"tel:{contact['phone']}"))
+
+        # Handle legacy format
+        if data.get('portfolio'):
+            contact_parts.append(('Portfolio', data['portfolio']))
+        if data.get('linkedin'):
+            contact_parts.append(('LinkedIn', data['linkedin']))
+        if data.get('email') and not any(part[0] == data['email'] for part in contact_parts):
+            contact_parts.append((data['email'], f"mailto:{data['email']}"))
+        if data.get('phone') and not any(part[0] == data['phone'] for part in contact_parts):
+            contact_parts.append((data['phone'], f"tel:{data['phone']}"))
+
+        if contact_parts:
+            add_hyperlinked_paragraph(doc, contact_parts)
+
+        # === PROFESSIONAL SUMMARY ===
+        if data.get('professional_summary'):
+            add_section_heading("Professional Summary")
+            add_bullet_points(data['professional_summary'], "$.professional_summary")
+
+        # === TECHNICAL SKILLS ===
+        if data.get('technical_skills'):
+            add_section_heading("Technical Skills")
+            for category, skills in data['technical_skills'].items():
+                p = doc.add_paragraph()
+                p.paragraph_format.space_after = Pt(2)
+                run = p.add_run(f"• {category}: ")
+                run.bold = True
+                run.font.name = font_name
+                run.font.size = Pt(font_size)
+                self.make_text_bold_for_skills(p, ", ".join(skills), bold_skills, font_name, font_size,
+                                               spans=highlight_index.spans_for(f"$.technical_skills.{category}"))
+
+        # === EXPERIENCE ===
+        if data.get('experience'):
+            add_section_heading("Professional Experience")
+            for job_index, job in enumerate(data['experience']):
+                job_path = f"$.experience[{job_index}]"
+                p = doc.add_paragraph()
+                run = p.add_run(f"Role: {job['role']}")
+                run.bold = True
+                run.font.name = font_name
+                run.font.size = Pt(font_size)
+                p.paragraph_format.space_after = Pt(0)
+
+                p = doc.add_paragraph()
+                p.paragraph_format.tab_stops.clear_all()
+                p.paragraph_format.tab_stops.add_tab_stop(Inches(6.3))
+                run_left = p.add_run(f"Client: {job['company']}")
+                run_left.bold = True
+                run_left.font.name = font_name
+                run_left.font.size = Pt(font_size)
+                if job.get('duration'):
+                    run_right = p.add_run(f"\t{job['duration']}")
+                    run_right.bold = True
+                    run_right.font.name = font_name
+                    run_right.font.size = Pt(font_size - 1)
+                    run_right.font.color.rgb = RGBColor(0, 0, 0)
+                p.paragraph_format.space_after = Pt(4)
+
+                if job.get('project_overview'):
                     p = doc.add_paragraph()
-                    p.alignment = WD_ALIGN_PARAGRAPH.LEFT
-                    run = p.add_run(text.upper())
+                    run = p.add_run("Project Overview: ")
                     run.bold = True
                     run.font.name = font_name
                     run.font.size = Pt(font_size)
-                    run.font.color.rgb = RGBColor(0, 0, 0)
-                    p_border = OxmlElement('w:pBdr')
-                    bottom = OxmlElement('w:bottom')
-                    bottom.set(qn('w:val'), 'single')
-                    bottom.set(qn('w:sz'), '6')
-                    bottom.set(qn('w:space'), '1')
-                    bottom.set(qn('w:color'), '000000')
-                    p_border.append(bottom)
-                    p._p.get_or_add_pPr().append(p_border)
+                    self.make_text_bold_for_skills(p, job['project_overview'], bold_skills, font_name, font_size,
+                                                   spans=highlight_index.spans_for(f"{job_path}.project_overview"))
                     p.paragraph_format.space_after = Pt(4)
 
-                def add_bullet_points(items):
-                    """Add bullet points with bold skills formatting"""
-                    for item in items:
-                        p = doc.add_paragraph(style='List Bullet')
-                        p.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-                        p.paragraph_format.space_after = Pt(2)
-                        p.paragraph_format.left_indent = Inches(0.25)
-                        
-                        # Use the new function to add text with bold skills
-                        self.make_text_bold_for_skills(p, item, bold_skills, font_name, font_size)
-
-                def add_hyperlinked_paragraph(doc, text_parts):
-                    paragraph = doc.add_paragraph()
-                    paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                    paragraph.paragraph_format.space_after = Pt(4)
-                    for idx, (display_text, url) in enumerate(text_parts):
-                        r_id = doc.part.relate_to(url, RELATIONSHIP_TYPE.HYPERLINK, is_external=True)
-                        hyperlink = OxmlElement('w:hyperlink')
-                        hyperlink.set(qn('r:id'), r_id)
-                        new_run = OxmlElement('w:r')
-                        rPr = OxmlElement('w:rPr')
-                        
-                        # Apply font to hyperlink
-                        font_elem = OxmlElement('w:rFonts')
-                        font_elem.set(qn('w:ascii'), font_name)
-                        font_elem.set(qn('w:hAnsi'), font_name)
-                        rPr.append(font_elem)
-                        
-                        color = OxmlElement('w:color')
-                        color.set(qn('w:val'), '0000FF')
-                        rPr.append(color)
-                        underline = OxmlElement('w:u')
-                        underline.set(qn('w:val'), 'single')
-                        rPr.append(underline)
-                        new_run.append(rPr)
-                        text = OxmlElement('w:t')
-                        text.text = display_text
-                        new_run.append(text)
-                        hyperlink.append(new_run)
-                        paragraph._p.append(hyperlink)
-                        if idx != len(text_parts) - 1:
-                            run = paragraph.add_run(" | ")
-                            run.font.name = font_name
-
-                # === HEADER ===
-                add_centered_paragraph(data['name'], bold=True, size=font_size + 3)
-                add_centered_paragraph(data.get('title', ''), size=font_size)
-
-                contact = data.get('contact', {})
-                contact_parts = []
-                if contact.get('portfolio'):
-                    contact_parts.append(('Portfolio', contact['portfolio']))
-                if contact.get('linkedin'):
-                    contact_parts.append(('LinkedIn', contact['linkedin']))
-                if contact.get('email'):
-                    contact_parts.append((contact['email'], f"mailto:{contact['email']}"))
-                if contact.get('phone'):
-                    contact_parts.append((contact['phone'], f"tel:{contact['phone']}"))
-
-                # Handle legacy format
-                if data.get('portfolio'):
-                    contact_parts.append(('Portfolio', data['portfolio']))
-                if data.get('linkedin'):
-                    contact_parts.append(('LinkedIn', data['linkedin']))
-                if data.get('email') and not any(part[0] == data['email'] for part in contact_parts):
-                    contact_parts.append((data['email'], f"mailto:{data['email']}"))
-                if data.get('phone') and not any(part[0] == data['phone'] for part in contact_parts):
-                    contact_parts.append((data['phone'], f"tel:{data['phone']}"))
-
-                if contact_parts:
-                    add_hyperlinked_paragraph(doc, contact_parts)
-
-                # === PROFESSIONAL SUMMARY ===
-                if data.get('professional_summary'):
-                    add_section_heading("Professional Summary")
-                    add_bullet_points(data['professional_summary'])  # This will use bold skills
-
-                # === TECHNICAL SKILLS ===
-                if data.get('technical_skills'):
-                    add_section_heading("Technical Skills")
-                    for category, skills in data['technical_skills'].items():
-                        p = doc.add_paragraph()
-                        p.paragraph_format.space_after = Pt(2)
-                        run = p.add_run(f"• {category}: ")
-                        run.bold = True
-                        run.font.name = font_name
-                        run.font.size = Pt(font_size)
-                        skill_run = p.add_run(", ".join(skills))
-                        skill_run.font.name = font_name
-                        skill_run.font.size = Pt(font_size)
-
-                # === EXPERIENCE ===
-                if data.get('experience'):
-                    add_section_heading("Professional Experience")
-                    for job in data['experience']:
-                        p = doc.add_paragraph()
-                        run = p.add_run(f"Role: {job['role']}")
-                        run.bold = True
-                        run.font.name = font_name
-                        run.font.size = Pt(font_size)
-                        p.paragraph_format.space_after = Pt(0)
-
-                        p = doc.add_paragraph()
-                        p.paragraph_format.tab_stops.clear_all()
-                        p.paragraph_format.tab_stops.add_tab_stop(Inches(6.3))
-                        run_left = p.add_run(f"Client: {job['company']}")
-                        run_left.bold = True
-                        run_left.font.name = font_name
-                        run_left.font.size = Pt(font_size)
-                        if job.get('duration'):
-                            run_right = p.add_run(f"\t{job['duration']}")
-                            run_right.bold = True
-                            run_right.font.name = font_name
-                            run_right.font.size = Pt(font_size - 1)
-                            run_right.font.color.rgb = RGBColor(0, 0, 0)
-                        p.paragraph_format.space_after = Pt(4)
-
-                        if job.get('project_overview'):
-                            p = doc.add_paragraph()
-                            run = p.add_run("Project Overview: ")
-                            run.bold = True
-                            run.font.name = font_name
-                            run.font.size = Pt(font_size)
-                            desc_run = p.add_run(job['project_overview'])
-                            desc_run.font.name = font_name
-                            desc_run.font.size = Pt(font_size)
-                            p.paragraph_format.space_after = Pt(4)
-
-                        if job.get('responsibilities'):
-                            p = doc.add_paragraph()
-                            run = p.add_run("Responsibilities: ")
-                            run.bold = True
-                            run.font.name = font_name
-                            run.font.size = Pt(font_size)
-                            p.paragraph_format.space_after = Pt(2)
-                            add_bullet_points(job['responsibilities'])  # This will use bold skills
-
-                        if job.get('environment'):
-                            p = doc.add_paragraph()
-                            run = p.add_run("Environment: ")
-                            run.bold = True
-                            run.font.name = font_name
-                            run.font.size = Pt(font_size)
-                            env_run = p.add_run(", ".join(job['environment']))
-                            env_run.font.name = font_name
-                            env_run.font.size = Pt(font_size)
-                            p.paragraph_format.space_after = Pt(8)
-
-                # === EDUCATION ===
-                if data.get('education') and isinstance(data['education'], dict):
-                    add_section_heading("Education")
-                    edu = data['education']
+                if job.get('responsibilities'):
                     p = doc.add_paragraph()
-                    line_parts = []
-                    if edu.get('degree'):
-                        line_parts.append(edu['degree'])
-                    if edu.get('field'):
-                        line_parts.append(edu['field'])
-                    if edu.get('institution'):
-                        line_parts.append(f"at {edu['institution']}")
-                    if edu.get('year'):
-                        line_parts.append(f"({edu['year']})")
-                    if line_parts:
-                        run = p.add_run(", ".join(line_parts))
-                        run.font.name = font_name
-                        run.font.size = Pt(font_size)
+                    run = p.add_run("Responsibilities: ")
+                    run.bold = True
+                    run.font.name = font_name
+                    run.font.size = Pt(font_size)
                     p.paragraph_format.space_after = Pt(2)
+                    add_bullet_points(job['responsibilities'], f"{job_path}.responsibilities")
+
+                if job.get('environment'):
+                    p = doc.add_paragraph()
+                    run = p.add_run("Environment: ")
+                    run.bold = True
+                    run.font.name = font_name
+                    run.font.size = Pt(font_size)
+                    self.make_text_bold_for_skills(p, ", ".join(job['environment']), bold_skills, font_name, font_size,
+                                                   spans=highlight_index.spans_for(f"{job_path}.environment"))
+                    p.paragraph_format.space_after = Pt(8)
+
+        # === EDUCATION ===
+        if data.get('education') and isinstance(data['education'], dict):
+            add_section_heading("Education")
+            edu = data['education']
+            p = doc.add_paragraph()
+            line_parts = []
+            if edu.get('degree'):
+                line_parts.append(edu['degree'])
+            if edu.get('field'):
+                line_parts.append(edu['field'])
+            if edu.get('institution'):
+                line_parts.append(f"at {edu['institution']}")
+            if edu.get('year'):
+                line_parts.append(f"({edu['year']})")
+            if line_parts:
+                run = p.add_run(", ".join(line_parts))
+                run.font.name = font_name
+                run.font.size = Pt(font_size)
+            p.paragraph_format.space_after = Pt(2)
+
+        # === CERTIFICATIONS ===
+        if data.get('certifications'):
+            add_section_heading("Certifications")
+            for cert in data['certifications']:
+                p = doc.add_paragraph(style='List Bullet')
+                run = p.add_run(cert)
+                run.font.name = font_name
+                run.font.size = Pt(font_size)
+                p.paragraph_format.space_after = Pt(2)
+
+        return doc
+
+    def generate_resume_from_json(self, json_string, filename, output_dir, selected_format, font_name, font_size, bold_skills,
+                                  bundle=None, timings=None, source=None, on_stage=None, cancel_event=None,
+                                  export_spans=False):
+        try:
+            data = json.loads(json_string)
+            if timings is None:
+                timings = {}
+            if on_stage is None:
+                on_stage = lambda stage: None
+
+            on_stage("Rendering")
+            render_start = time.perf_counter()
+            highlight_index = HighlightIndex(data, bold_skills)
+            doc = self.build_resume_document(data, font_name, font_size, bold_skills, highlight_index)
+            timings['render'] = round(time.perf_counter() - render_start, 4)
+
+            if cancel_event is not None and cancel_event.is_set():
+                print("⚠️ Generation cancelled")
+                return False
 
-                # === CERTIFICATIONS ===
-                if data.get('certifications'):
-                    add_section_heading("Certifications")
-                    for cert in data['certifications']:
-                        p = doc.add_paragraph(style='List Bullet')
-                        run = p.add_run(cert)
-                        run.font.name = font_name
-                        run.font.size = Pt(font_size)
-                        p.paragraph_format.space_after = Pt(2)
-
-                # Save DOCX
+            spans_json = None
+            if export_spans:
+                spans_json = json.dumps(highlight_index.to_dict(), indent=2).encode('utf-8')
+
+            # Stream straight into the bundle, nothing is left in output_dir
+            if bundle is not None:
+                if spans_json is not None:
+                    bundle.add_bytes(f"{filename}{SPANS_SUFFIX}", spans_json, source=source, timings=timings)
+                return self.write_resume_to_bundle(doc, filename, selected_format, bundle, timings, source)
+
+            # Use the exact output directory specified (no date-based subdirectory)
+            os.makedirs(output_dir, exist_ok=True)
+
+            if spans_json is not None:
+                spans_path = os.path.join(output_dir, f"{filename}{SPANS_SUFFIX}")
+                with open(spans_path, 'wb') as f:
+                    f.write(spans_json)
+                print(f"✅ Bold spans saved to: {spans_path}")
+            
+            # Determine file paths
+            docx_filename = f"{filename}.docx"
+            docx_path = os.path.join(output_dir, docx_filename)
+            pdf_path = os.path.join(output_dir, f"{filename}.pdf")
+            pdf_success = False
+            
+            if selected_format == "PDF Only":
+                # The DOCX is only converter input, so it never touches output_dir
+                on_stage("Converting")
+                pdf_success = self.convert_intermediate_docx(doc, filename, lambda path: shutil.copyfile(path, pdf_path),
+                                                             timings)
+                if not pdf_success:
+                    print("⚠️ PDF conversion failed")
+                    return False
+                print(f"✅ PDF saved to: {pdf_path}")
+            else:
+                on_stage("Saving")
+                save_start = time.perf_counter()
                 doc.save(docx_path)
+                timings['save'] = round(time.perf_counter() - save_start, 4)
                 print(f"✅ DOCX saved to: {docx_path}")
 
-            # Convert to PDF if needed
-            if selected_format in ["PDF Only", "Both (DOCX + PDF)"]:
-                if selected_format == "PDF Only" and not os.path.exists(docx_path):
-                    # Generate DOCX temporarily for PDF conversion
-                    self.generate_resume_from_json(json_string, filename, output_dir, "DOCX Only", font_name, font_size, bold_skills)
+            # Convert the saved DOCX as well when both formats are wanted
+            if selected_format == "Both (DOCX + PDF)":
+                if cancel_event is not None and cancel_event.is_set():
+                    print("⚠️ Generation cancelled")
+                    return False
                 
                 # Convert using multiple methods
+                on_stage("Converting")
+                convert_start = time.perf_counter()
                 pdf_success, pdf_path = self.convert_docx_to_pdf_multiple_methods(docx_path)
+                timings['convert'] = round(time.perf_counter() - convert_start, 4)
                 
                 if not pdf_success:
                     print("⚠️ PDF conversion failed")
-                    if selected_format == "PDF Only":
-                        return False
                 else:
                     print(f"✅ PDF saved to: {pdf_path}")
-                
-                # Remove temporary DOCX if PDF Only was selected
-                if selected_format == "PDF Only" and os.path.exists(docx_path):
-                    os.remove(docx_path)
-                    print("✅ Temporary DOCX file removed")
+
+            artifact_paths = []
+            if selected_format in ["DOCX Only", "Both (DOCX + PDF)"]:
+                artifact_paths.append(('docx', docx_path))
+            if selected_format in ["PDF Only", "Both (DOCX + PDF)"] and pdf_success:
+                artifact_paths.append(('pdf', pdf_path))
+            self.catalog_render(json_string, source, data.get('title'), filename, bold_skills, font_name, font_size,
+                                selected_format, artifact_paths, timings)
+            # Remember which skills this resume matched so keyword edits can target it
+            self.index_render(output_dir, filename, source, highlight_index)
 
             print(f"✅ Files saved to: {output_dir}")
             return True
@@ -869,6 +2476,116 @@ class ResumeGeneratorApp:
             print(f"❌ Error generating resume: {e}")
             return False
 
+    def catalog_render(self, json_string, source, title, filename, bold_skills, font_name, font_size, selected_format,
+                       artifact_paths, timings):
+        """Record a finished render in the resume store; catalog problems never fail generation"""
+        try:
+            store = self.get_resume_store()
+            source_id = store.add_source(json_string, source)
+            store.record_render(source_id, title, filename, skills_profile(bold_skills), font_name, font_size,
+                                selected_format, artifact_paths, timings)
+        except Exception as e:
+            print(f"❌ Failed to catalog render: {e}")
+    
+    def index_render(self, output_dir, filename, source, highlight_index):
+        """Record a finished render in the skill index; index problems never fail generation"""
+        try:
+            self.get_skill_index(output_dir).record(filename, source, highlight_index)
+        except Exception as e:
+            print(f"❌ Failed to index render: {e}")
+    
+    def save_skill_indexes(self):
+        """Persist every skill index with unsaved renders; called once per single render, batch or watch cycle"""
+        with self.skill_indexes_lock:
+            skill_indexes = list(self.skill_indexes.values())
+        for skill_index in skill_indexes:
+            try:
+                skill_index.save()
+            except Exception as e:
+                print(f"❌ Failed to save skill index {skill_index.index_path}: {e}")
+    
+    def convert_intermediate_docx(self, doc, filename, on_pdf, timings, docx_bytes=None):
+        """Convert doc to PDF via a throwaway DOCX in RAM-backed scratch space; on_pdf(pdf_path) runs before cleanup"""
+        temp_dir = tempfile.mkdtemp(prefix="resume_", dir=intermediate_temp_dir())
+        try:
+            temp_docx_path = os.path.join(temp_dir, f"{filename}.docx")
+            if docx_bytes is not None:
+                with open(temp_docx_path, 'wb') as f:
+                    f.write(docx_bytes)
+            else:
+                # Compression is wasted on a throwaway file in RAM, but an
+                # uncompressed package is ~20x larger, so on a real disk it costs more than it saves
+                save_start = time.perf_counter()
+                if ram_scratch_dir():
+                    save_docx_uncompressed(doc, temp_docx_path)
+                else:
+                    doc.save(temp_docx_path)
+                timings['save'] = round(time.perf_counter() - save_start, 4)
+            
+            convert_start = time.perf_counter()
+            pdf_success, pdf_path = self.convert_docx_to_pdf_multiple_methods(temp_docx_path)
+            timings['convert'] = round(time.perf_counter() - convert_start, 4)
+            
+            if pdf_success:
+                on_pdf(pdf_path)
+            return pdf_success
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+    
+    def write_resume_to_bundle(self, doc, filename, selected_format, bundle, timings, source):
+        """Write the DOCX and/or PDF for one resume into an open ResumeBundleWriter"""
+        docx_bytes = None
+        if selected_format in ["DOCX Only", "Both (DOCX + PDF)"]:
+            save_start = time.perf_counter()
+            buffer = io.BytesIO()
+            doc.save(buffer)
+            docx_bytes = buffer.getvalue()
+            timings['save'] = round(time.perf_counter() - save_start, 4)
+            bundle.add_bytes(f"{filename}.docx", docx_bytes, source=source, timings=timings)
+            print(f"✅ DOCX added to bundle: {filename}.docx")
+
+        if selected_format in ["PDF Only", "Both (DOCX + PDF)"]:
+            pdf_success = self.convert_intermediate_docx(
+                doc, filename,
+                lambda path: bundle.add_file(f"{filename}.pdf", path, source=source, timings=timings),
+                timings, docx_bytes=docx_bytes)
+
+            if not pdf_success:
+                print("⚠️ PDF conversion failed")
+                if selected_format == "PDF Only":
+                    return False
+            else:
+                print(f"✅ PDF added to bundle: {filename}.pdf")
+
+        return True
+
+    def generate_batch_bundle(self, json_paths, bundle_path, selected_format, font_name, font_size, bold_skills,
+                              archive_format="zip", compression_level=6, export_spans=False):
+        """Generate every resume in json_paths straight into a single ZIP/TAR bundle"""
+        results = []
+        used_filenames = set()
+
+        with ResumeBundleWriter(bundle_path, archive_format, compression_level) as bundle:
+            for json_path in json_paths:
+                try:
+                    with open(json_path, 'r', encoding='utf-8') as f:
+                        json_string = f.read()
+                    data = json.loads(json_string)
+                except Exception as e:
+                    print(f"❌ Failed to read {json_path}: {e}")
+                    results.append((json_path, False))
+                    continue
+
+                # Keep archive names unique when several resumes share a title
+                filename = self.claim_unique_filename(data.get('title', ''), used_filenames)
+
+                success = self.generate_resume_from_json(json_string, filename, None, selected_format, font_name, font_size,
+                                                         bold_skills, bundle=bundle, source=json_path, export_spans=export_spans)
+                results.append((json_path, success))
+
+        print(f"✅ Bundle saved to: {bundle_path}")
+        return results
+
 if __name__ == "__main__":
     root = tk.Tk()
     
@@ -0,0 +1,161 @@
+"""Golden-output equivalence check for the resume renderer.
+
+Renders every resume in golden/corpus through the same code the app uses and
+compares normalized word/document.xml, its relationships part and the set of
+bold runs against the stored outputs in golden/expected. Each render/save path
+is timed next to its comparison so optimizations can be shown to be both
+correct and faster.
+
+    python golden_check.py             # compare against golden outputs
+    python golden_check.py --update    # re-record golden outputs
+"""
+import argparse
+import difflib
+import io
+import json
+import os
+import statistics
+import sys
+import time
+import zipfile
+
+from docx import Document
+from lxml import etree
+
+from Addition_Of_two_v2 import ResumeGeneratorApp, HighlightIndex, save_docx_uncompressed
+
+GOLDEN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "golden")
+CORPUS_DIR = os.path.join(GOLDEN_DIR, "corpus")
+EXPECTED_DIR = os.path.join(GOLDEN_DIR, "expected")
+BOLD_SKILLS_PATH = os.path.join(GOLDEN_DIR, "bold_keywords.json")
+FONT_NAME = "Calibri"
+FONT_SIZE = 11
+
+DOCUMENT_PART = "word/document.xml"
+RELS_PART = "word/_rels/document.xml.rels"
+
+
+def save_deflated(doc):
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+def save_stored(doc):
+    buffer = io.BytesIO()
+    save_docx_uncompressed(doc, buffer)
+    return buffer.getvalue()
+
+
+# Each path renders and serializes the resume differently but must produce identical parts
+RENDER_PATHS = {
+    'default': save_deflated,
+    'stored': save_stored,
+}
+
+
+def normalize_xml(blob):
+    """Canonical XML so attribute order and whitespace differences don't count as changes"""
+    root = etree.fromstring(blob)
+    if root.tag.endswith('}Relationships'):
+        root[:] = sorted(root, key=lambda rel: rel.get('Id'))
+    return etree.tostring(etree.fromstring(etree.tostring(root, method='c14n')), pretty_print=True).decode('utf-8')
+
+
+def extract_bold_spans(docx_bytes):
+    """[[paragraph index, bold run text], ...] for every bold run in the body"""
+    doc = Document(io.BytesIO(docx_bytes))
+    return [[index, run.text] for index, paragraph in enumerate(doc.paragraphs) for run in paragraph.runs if run.bold]
+
+
+def format_bold_spans(spans):
+    # One span per line keeps golden diffs readable
+    lines = [json.dumps(span, ensure_ascii=False) for span in spans]
+    return "[\n" + ",\n".join(f"  {line}" for line in lines) + ("\n" if lines else "") + "]\n"
+
+
+def render(app, data, bold_skills, save):
+    render_start = time.perf_counter()
+    doc = app.build_resume_document(data, FONT_NAME, FONT_SIZE, bold_skills, HighlightIndex(data, bold_skills))
+    render_seconds = time.perf_counter() - render_start
+    save_start = time.perf_counter()
+    docx_bytes = save(doc)
+    save_seconds = time.perf_counter() - save_start
+    return docx_bytes, render_seconds, save_seconds
+
+
+def outputs_for(docx_bytes):
+    with zipfile.ZipFile(io.BytesIO(docx_bytes)) as package:
+        return {
+            'document.xml': normalize_xml(package.read(DOCUMENT_PART)),
+            'document.xml.rels': normalize_xml(package.read(RELS_PART)),
+            'bold_spans.json': format_bold_spans(extract_bold_spans(docx_bytes)),
+        }
+
+
+def show_diff(expected, actual, label, max_lines=20):
+    diff = list(difflib.unified_diff(expected.splitlines(), actual.splitlines(),
+                                     f"expected/{label}", f"actual/{label}", lineterm=""))
+    for line in diff[:max_lines]:
+        print(f"      {line}")
+    if len(diff) > max_lines:
+        print(f"      ... {len(diff) - max_lines} more diff lines")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare rendered resumes against golden outputs")
+    parser.add_argument('--update', action='store_true', help="re-record golden outputs from the default path")
+    parser.add_argument('--repeat', type=int, default=5, help="renders per path for timing (median is reported)")
+    args = parser.parse_args()
+
+    # Rendering needs no window; the app's build methods only use the instance for helpers
+    app = ResumeGeneratorApp.__new__(ResumeGeneratorApp)
+    with open(BOLD_SKILLS_PATH, 'r', encoding='utf-8') as f:
+        bold_skills = json.load(f)['skills']
+
+    failures = 0
+    for corpus_file in sorted(name for name in os.listdir(CORPUS_DIR) if name.endswith('.json')):
+        case = os.path.splitext(corpus_file)[0]
+        with open(os.path.join(CORPUS_DIR, corpus_file), 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        expected_dir = os.path.join(EXPECTED_DIR, case)
+
+        if args.update:
+            docx_bytes, _, _ = render(app, data, bold_skills, RENDER_PATHS['default'])
+            os.makedirs(expected_dir, exist_ok=True)
+            for name, content in outputs_for(docx_bytes).items():
+                with open(os.path.join(expected_dir, name), 'w', encoding='utf-8', newline='\n') as f:
+                    f.write(content)
+            print(f"✅ Recorded golden outputs for {case}")
+            continue
+
+        expected = {}
+        for name in ('document.xml', 'document.xml.rels', 'bold_spans.json'):
+            with open(os.path.join(expected_dir, name), 'r', encoding='utf-8') as f:
+                expected[name] = f.read()
+
+        for path_name, save in RENDER_PATHS.items():
+            render_times = []
+            save_times = []
+            for _ in range(max(args.repeat, 1)):
+                docx_bytes, render_seconds, save_seconds = render(app, data, bold_skills, save)
+                render_times.append(render_seconds)
+                save_times.append(save_seconds)
+
+            actual = outputs_for(docx_bytes)
+            mismatched = [name for name in expected if expected[name] != actual[name]]
+            status = "✅ match" if not mismatched else f"❌ differs: {', '.join(mismatched)}"
+            print(f"{case:<20} {path_name:<10} render {statistics.median(render_times) * 1000:7.1f} ms  "
+                  f"save {statistics.median(save_times) * 1000:7.1f} ms  {len(docx_bytes):>8} B  {status}")
+            for name in mismatched:
+                show_diff(expected[name], actual[name], f"{case}/{name}")
+            failures += bool(mismatched)
+
+    if failures:
+        print(f"❌ {failures} render path(s) differ from golden outputs")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())